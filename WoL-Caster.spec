@@ -1,11 +1,17 @@
 # -*- mode: python ; coding: utf-8 -*-
+import os
+
+datas = [('assets/oui_database.txt', 'assets'), ('assets/Wol-Caster.icns', 'assets')]
+# Optional pre-parsed OUI index (`make oui-index`)
+if os.path.exists('assets/oui_database.pkl'):
+    datas.append(('assets/oui_database.pkl', 'assets'))
 
 
 a = Analysis(
     ['wol_caster.py'],
     pathex=[],
     binaries=[],
-    datas=[('assets/oui_database.txt', 'assets'), ('assets/Wol-Caster.icns', 'assets')],
+    datas=datas,
     hiddenimports=['tkinter', 'tkinter.ttk', 'tkinter.messagebox', 'tkinter.filedialog'],
     hookspath=[],
     hooksconfig={},
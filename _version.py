@@ -0,0 +1,3 @@
+"""Single source of truth for the WoL-Caster version."""
+
+__version__ = "1.0.0"
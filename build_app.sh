@@ -16,6 +16,10 @@ echo "🧪 Menu configuration test skipped (logic now built into wol_caster.py)"
 echo "🧹 Cleaning previous builds..."
 rm -rf build/ dist/ __pycache__/
 
+# Pre-parse the OUI database so the app doesn't parse the text file at startup
+echo "🏭 Building OUI vendor index..."
+python3 -c "import wol_caster; wol_caster.build_oui_index()" || echo "⚠️  OUI index skipped (text database will be used)"
+
 # Build the app bundle
 echo "🏗️  Building with PyInstaller..."
 pyinstaller WoL-Caster.spec
@@ -5,18 +5,25 @@ A powerful, intelligent cross-platform utility that automatically detects all yo
 and casts Wake-on-LAN magic packets with a beautiful, mystical interface.
 """
 
-__version__ = "1.0.0"
+from _version import __version__
+
 __author__ = "Cardigans of the Galaxy"
 __description__ = "Wake-on-LAN Network Broadcaster with Perfect GUI & CLI Interrupt"
 
 # Standard library imports
+import errno
+import functools
 import ipaddress
+import itertools
 import json
+import mmap
 import os
 import pickle
 import platform
+import queue
 import re
 import select
+import selectors
 import shutil
 import socket
 import struct
@@ -24,11 +31,109 @@ import subprocess
 import sys
 import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
 
 # Third-party imports
 import netifaces
 
+# Not available on Windows; only used to read the open-file limit
+try:
+    import resource
+except ImportError:
+    resource = None
+
+# Optional faster JSON codec for the persistent data files; both emit/accept UTF-8 bytes
+try:
+    import orjson
+    _json_loads = orjson.loads
+    _json_dumps = orjson.dumps
+
+    def _json_dumps_pretty(obj):
+        """Indented JSON text for display and exports; unknown types are stringified."""
+        return orjson.dumps(obj, default=str,
+                            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS).decode()
+except ImportError:
+    _json_loads = json.loads
+    def _json_dumps(obj):
+        return json.dumps(obj, separators=(',', ':')).encode()
+
+    def _json_dumps_pretty(obj):
+        """Indented JSON text for display and exports; unknown types are stringified."""
+        return json.dumps(obj, indent=2, default=str)
+
+def _fd_limit():
+    """Soft limit on open file descriptors, or a conservative guess where it can't be read."""
+    if resource is not None:
+        try:
+            soft, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+            if soft != resource.RLIM_INFINITY and soft > 0:
+                return soft
+        except (OSError, ValueError):
+            pass
+    # Windows select() tops out at 512 sockets by default
+    return 512
+
+_FD_LIMIT = _fd_limit()
+
+# Mirrors the CLI debug toggle so module-level helpers can check it with one global lookup
+_DEBUG = False
+
+# Fixed per-process facts, resolved once instead of in every scan worker
+_SYSTEM = platform.system()
+_PING_CMD = ['ping', '-n', '1', '-w', '1000'] if _SYSTEM == 'Windows' else ['ping', '-c', '1', '-W', '1']
+_STANDBY_PORTS = (80, 443, 22, 23, 3389, 5900)  # HTTP, HTTPS, SSH, Telnet, RDP, VNC
+
+# Errors that mean the process ran out of descriptors - the host's state is unknown, not "closed"
+_FD_EXHAUSTED_ERRNOS = (errno.EMFILE, errno.ENFILE)
+
+# Standby probes open one socket per port at once; cap how many probes run together so a
+# wide scan stays within half the open-file limit, leaving the rest for ICMP sockets, pings, etc.
+_TCP_PROBE_SLOTS = threading.BoundedSemaphore(max(1, (_FD_LIMIT // 2) // len(_STANDBY_PORTS)))
+
+# Descriptors one scan worker can hold at once: a socket per standby port, plus its ICMP
+# socket and the pipes of an `arp`/`ping` subprocess
+_FDS_PER_SCAN_WORKER = len(_STANDBY_PORTS) + 4
+
+def _scan_worker_count():
+    """
+    Threads for the scan pool: WOL_SCAN_THREADS if set, else 32 per core capped at 256
+    and at what the open-file limit can supply (_FDS_PER_SCAN_WORKER each).
+    """
+    try:
+        override = int(os.environ.get('WOL_SCAN_THREADS', ''))
+        if override > 0:
+            return override
+    except ValueError:
+        pass
+    return max(4, min(256, 32 * (os.cpu_count() or 1), _FD_LIMIT // _FDS_PER_SCAN_WORKER))
+
+# Worker threads used to probe hosts during a network scan (the work is I/O-bound)
+SCAN_MAX_WORKERS = _scan_worker_count()
+
+# One long-lived pool shared by every scan pass and interface, so threads aren't respawned per scan
+_SCAN_POOL = ThreadPoolExecutor(max_workers=SCAN_MAX_WORKERS, thread_name_prefix="wol-scan")
+
+# Common service names used to label hosts by an open port
+_SERVICE_NAMES = {
+    22: "SSH",
+    23: "Telnet",
+    80: "HTTP",
+    443: "HTTPS",
+    3389: "RDP",
+    5900: "VNC",
+    8080: "HTTP-Alt",
+    8443: "HTTPS-Alt"
+}
+_OUI_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'oui_database.txt')
+_OUI_INDEX_PATH = os.path.join(os.path.dirname(__file__), 'assets', 'oui_database.pkl')  # Optional, built by `make oui-index`
+
+# MAC addresses as printed by arp: 0:3e:e1:b7:57:54 (macOS) or 00-3e-e1-b7-57-54 (Windows)
+_MAC_RE = re.compile(r'(?:[0-9a-fA-F]{1,2}[:-]){5}[0-9a-fA-F]{1,2}')
+_MAC_RE_STRICT = re.compile(r'(?:[0-9a-fA-F]{2}[:-]){5}[0-9a-fA-F]{2}')
+_IPV4_RE = re.compile(r'\b\d{1,3}(?:\.\d{1,3}){3}\b')
+# One `arp -an` line on macOS: "? (192.168.0.1) at 0:3e:e1:b7:57:54 on en0 ifscope [ethernet]"
+_ARP_ENTRY_RE = re.compile(r'\(([\d.]+)\) at ([0-9a-fA-F:]+) on (\S+)')
+
 # Smart GUI detection
 GUI_AVAILABLE = False
 try:
@@ -53,7 +158,7 @@ def is_gui_mode():
         return False
 
     # On macOS, check if we're running as an app bundle
-    if platform.system() == 'Darwin':
+    if _SYSTEM == 'Darwin':
         if os.path.basename(sys.argv[0]).endswith('.app'):
             return True
         # Check if we're in an app bundle structure
@@ -61,7 +166,7 @@ def is_gui_mode():
             return True
 
     # On Windows, check if we're running as an executable without console
-    if platform.system() == 'Windows':
+    if _SYSTEM == 'Windows':
         try:
             # If we can't write to stdout, we're likely running without console (windowed mode)
             sys.stdout.write('')
@@ -86,29 +191,40 @@ def is_gui_mode():
     # Default to CLI mode for terminal usage
     return False
 
-def get_terminal_size():
-    """Get terminal dimensions with fallback."""
+# A single table render asks for the size many times; reuse it briefly instead of re-querying the tty
+_term_size_cache = {'t': 0.0, 'size': None}
+
+def get_terminal_size(ttl=0.25):
+    """Get terminal dimensions with fallback (cached for `ttl` seconds; pass 0 to force a fresh read)."""
+    now = time.monotonic()
+    if _term_size_cache['size'] is not None and now - _term_size_cache['t'] < ttl:
+        return _term_size_cache['size']
+
     try:
-        return shutil.get_terminal_size()
+        size = shutil.get_terminal_size()
     except Exception:
         try:
-            return os.get_terminal_size()
+            size = os.get_terminal_size()
         except Exception:
             # Fallback dimensions
-            return os.terminal_size((80, 24))
+            size = os.terminal_size((80, 24))
+
+    _term_size_cache['t'] = now
+    _term_size_cache['size'] = size
+    return size
 
 def try_resize_terminal():
     """Attempt to resize terminal to 100x50."""
     try:
         # Only attempt on macOS and Linux terminals that support it
-        if platform.system() in ['Darwin', 'Linux']:
+        if _SYSTEM in ['Darwin', 'Linux']:
             # Try to resize using ANSI escape sequences
             sys.stdout.write('\033[8;50;100t')
             sys.stdout.flush()
             time.sleep(0.1)  # Give terminal time to resize
             
             # Check if resize was successful
-            new_size = get_terminal_size()
+            new_size = get_terminal_size(ttl=0)
             if new_size.columns >= 80 and new_size.lines >= 30:
                 print("✅ Terminal resized successfully!")
                 print("🔄 Restarting CLI with proper terminal size...")
@@ -134,7 +250,7 @@ def should_launch_new_terminal():
 def launch_proper_terminal():
     """Launch CLI in a new, properly-sized terminal window."""
     try:
-        if platform.system() == 'Darwin':  # macOS
+        if _SYSTEM == 'Darwin':  # macOS
             # Get current working directory
             cwd = os.getcwd()
             # Check for both .venv and venv folders
@@ -260,14 +376,15 @@ def print_adaptive_table(headers, rows, min_col_width=8):
     # Calculate optimal column widths
     num_cols = len(headers)
 
-    # Calculate minimum required widths
-    col_widths = []
-    for i in range(num_cols):
-        max_width = len(headers[i])
-        for row in rows:
-            if i < len(row):
-                max_width = max(max_width, len(str(row[i])))
-        col_widths.append(max(min_col_width, max_width))
+    # Stringify every cell once; the same strings are measured here and printed below
+    str_rows = [[str(cell) for cell in row] for row in rows]
+
+    # Calculate minimum required widths in a single pass over the rows
+    col_widths = [max(min_col_width, len(header)) for header in headers]
+    for row in str_rows:
+        for i, cell in enumerate(row[:num_cols]):
+            if len(cell) > col_widths[i]:
+                col_widths[i] = len(cell)
 
     # Check if table fits in terminal
     total_width = sum(col_widths) + num_cols - 1
@@ -308,155 +425,437 @@ def print_adaptive_table(headers, rows, min_col_width=8):
     print(separator_line[:terminal_width])
 
     # Print rows
-    for row in rows:
-        row_strs = [str(cell) for cell in row]
+    for row_strs in str_rows:
         row_lines = format_table_row(row_strs, col_widths, terminal_width)
         for line in row_lines:
             print(line)
 
     print()
 
-def get_network_interfaces():
-    """Get all network interfaces and their IP addresses with subnet masks."""
-    interfaces = []
+# Interface enumeration rarely changes, so netifaces results are shared for a short TTL
+_iface_cache = {'t': 0.0, 'data': None}
+_iface_cache_lock = threading.Lock()
 
-    for interface_name in netifaces.interfaces():
-        try:
-            # Skip loopback interfaces
-            if interface_name.startswith('lo') or 'Loopback' in interface_name:
-                continue
+def _cached_interfaces(ttl=30.0):
+    """
+    Enumerate non-loopback interfaces and their IPv4 addresses, cached for `ttl` seconds.
+
+    Returns:
+        list: [(interface_name, [(ip, netmask), ...]), ...]
+    """
+    with _iface_cache_lock:
+        now = time.monotonic()
+        if _iface_cache['data'] is not None and now - _iface_cache['t'] < ttl:
+            return _iface_cache['data']
+
+        data = []
+        for interface_name in netifaces.interfaces():
+            try:
+                # Skip loopback interfaces
+                if interface_name.startswith('lo') or 'Loopback' in interface_name:
+                    continue
 
-            addrs = netifaces.ifaddresses(interface_name)
+                addrs = netifaces.ifaddresses(interface_name)
 
-            # Check for IPv4 addresses
-            if netifaces.AF_INET in addrs:
-                for addr_info in addrs[netifaces.AF_INET]:
+                # Collect IPv4 addresses
+                ipv4_addrs = []
+                for addr_info in addrs.get(netifaces.AF_INET, []):
                     ip = addr_info.get('addr')
-                    netmask = addr_info.get('netmask')
-
-                    if ip and netmask and ip != '127.0.0.1':
-                        try:
-                            # Create network object to get subnet info
-                            network = ipaddress.IPv4Network(f"{ip}/{netmask}", strict=False)
-                            interfaces.append({
-                                'interface': interface_name,
-                                'ip': ip,
-                                'network': str(network.network_address),
-                                'netmask': netmask,
-                                'subnet': str(network),
-                                'broadcast': str(network.broadcast_address)
-                            })
-                        except Exception:
-                            continue
-        except Exception:
-            continue
+                    if ip and ip != '127.0.0.1':
+                        ipv4_addrs.append((ip, addr_info.get('netmask')))
+                data.append((interface_name, ipv4_addrs))
+            except Exception:
+                continue
+
+        _iface_cache['t'] = now
+        _iface_cache['data'] = data
+        return data
+
+def invalidate_interface_cache():
+    """Drop cached interface, host, interface-type and service-probe data so the next scan starts fresh."""
+    with _iface_cache_lock:
+        _iface_cache['data'] = None
+        _host_info_cache['data'] = None
+        _iface_type_cache['data'] = None
+    with _service_port_cache_lock:
+        _service_port_cache.clear()
+
+def get_network_interfaces():
+    """Get all network interfaces and their IP addresses with subnet masks."""
+    interfaces = []
+
+    for interface_name, ipv4_addrs in _cached_interfaces():
+        for ip, netmask in ipv4_addrs:
+            if netmask:
+                try:
+                    # Create network object to get subnet info
+                    network = ipaddress.IPv4Network(f"{ip}/{netmask}", strict=False)
+                    interfaces.append({
+                        'interface': interface_name,
+                        'ip': ip,
+                        'network': str(network.network_address),
+                        'netmask': netmask,
+                        'subnet': str(network),
+                        'broadcast': str(network.broadcast_address)
+                    })
+                except Exception:
+                    continue
 
     # Now check for additional networks that might be accessible via this interface
-    # by looking at the routing table and ARP cache
+    # by looking at the ARP cache (read once and shared by every interface)
     additional_interfaces = []
-    for interface in interfaces:
+    if _SYSTEM == 'Darwin':  # macOS
         try:
-            # Check ARP table for additional networks
-            if platform.system() == 'Darwin':  # macOS
-                try:
-                    result = subprocess.run(['arp', '-a'], capture_output=True, text=True, timeout=5)
-                    if result.returncode == 0:
-                        arp_lines = result.stdout.split('\n')
-                        discovered_networks = set()
-
-                        for line in arp_lines:
-                            if interface['interface'] in line:
-                                # Extract IP from ARP line
-                                parts = line.split()
-                                for part in parts:
-                                    if '.' in part and part.count('.') == 3:
-                                        try:
-                                            ip_obj = ipaddress.IPv4Address(part)
-                                            # Check if this IP is in a different network than the interface
-                                            if ip_obj not in ipaddress.IPv4Network(interface['subnet'], strict=False):
-                                                # This IP is in a different network - create a new interface entry
-                                                # Try to determine the network by looking at the IP structure
-                                                network_parts = part.split('.')
-                                                if len(network_parts) == 4:
-                                                    # Assume /24 network for discovered IPs
-                                                    discovered_network = (f"{network_parts[0]}.{network_parts[1]}."
-                                                                         f"{network_parts[2]}.0/24")
-                                                    if discovered_network not in discovered_networks:
-                                                        discovered_networks.add(discovered_network)
-                                                        additional_interfaces.append({
-                                                            'interface': interface['interface'],
-                                                            'ip': interface['ip'],  # Use interface IP as gateway
-                                                            'network': (f"{network_parts[0]}.{network_parts[1]}."
-                                                                         f"{network_parts[2]}.0"),
-                                                            'netmask': '255.255.255.0',
-                                                            'subnet': discovered_network,
-                                                            'broadcast': (f"{network_parts[0]}.{network_parts[1]}."
-                                                                          f"{network_parts[2]}.255"),
-                                                            'discovered': True  # Mark as discovered, not primary
-                                                        })
-                                        except Exception:
-                                            continue
-                except Exception as e:
-                    # Debug output only in CLI debug mode
-                    if ('cli_persistent_data' in globals() and 
-                        cli_persistent_data.get('debug_mode', False)):
-                        print(f"🔍 DEBUG: ARP check failed: {e}")
-        except Exception:
-            continue
+            arp_entries = _read_arp_entries()
+        except Exception as e:
+            arp_entries = []
+            # Debug output only in CLI debug mode
+            if _DEBUG:
+                print(f"🔍 DEBUG: ARP check failed: {e}")
+
+        for interface in interfaces:
+            try:
+                discovered_networks = set()
+                # Membership is tested with plain integer masks rather than IPv4Network objects
+                interface_network = ipaddress.IPv4Network(interface['subnet'], strict=False)
+                network_int = int(interface_network.network_address)
+                mask_int = int(interface_network.netmask)
+
+                for part in _read_arp_neighbors(interface['interface'], arp_entries):
+                    try:
+                        ip_int = struct.unpack('!I', socket.inet_aton(part))[0]
+                        # Check if this IP is in a different network than the interface
+                        if ip_int & mask_int != network_int:
+                            # This IP is in a different network - create a new interface entry
+                            # Try to determine the network by looking at the IP structure
+                            network_parts = part.split('.')
+                            # Assume /24 network for discovered IPs
+                            discovered_network = (f"{network_parts[0]}.{network_parts[1]}."
+                                                 f"{network_parts[2]}.0/24")
+                            if discovered_network not in discovered_networks:
+                                discovered_networks.add(discovered_network)
+                                additional_interfaces.append({
+                                    'interface': interface['interface'],
+                                    'ip': interface['ip'],  # Use interface IP as gateway
+                                    'network': (f"{network_parts[0]}.{network_parts[1]}."
+                                                 f"{network_parts[2]}.0"),
+                                    'netmask': '255.255.255.0',
+                                    'subnet': discovered_network,
+                                    'broadcast': (f"{network_parts[0]}.{network_parts[1]}."
+                                                  f"{network_parts[2]}.255"),
+                                    'discovered': True  # Mark as discovered, not primary
+                                })
+                    except Exception:
+                        continue
+            except Exception:
+                continue
 
     # Combine primary and discovered interfaces
     all_interfaces = interfaces + additional_interfaces
 
     # Debug output only in CLI debug mode
-    if ('cli_persistent_data' in globals() and
-            cli_persistent_data.get('debug_mode', False)):
+    if _DEBUG:
         print(f"🔍 DEBUG: Found {len(interfaces)} primary interfaces and {len(additional_interfaces)} discovered networks")
 
     return all_interfaces
 
-def ping_host(ip):
-    """Ping a host to check if it's alive."""
+def _icmp_checksum(data):
+    """Compute the RFC 1071 internet checksum used by ICMP."""
+    if len(data) % 2:
+        data += b'\x00'
+    total = sum(struct.unpack(f'!{len(data) // 2}H', data))
+    total = (total >> 16) + (total & 0xFFFF)
+    total += total >> 16
+    return ~total & 0xFFFF
+
+def _icmp_echo_packet(ident, seq):
+    """Build an ICMP echo request with a valid checksum."""
+    payload = b'wol-caster'
+    header = struct.pack('!BBHHH', 8, 0, 0, ident, seq)
+    checksum = _icmp_checksum(header + payload)
+    return struct.pack('!BBHHH', 8, 0, checksum, ident, seq) + payload
+
+def _is_echo_reply(data):
+    """Whether a datagram read from an ICMP socket is an echo reply."""
+    # macOS hands back the IP header as well; Linux delivers bare ICMP
+    if data and data[0] >> 4 == 4:
+        data = data[(data[0] & 0x0F) * 4:]
+    return bool(data) and data[0] == 0
+
+def _icmp_echo(ip, timeout=1.0):
+    """
+    Send a single ICMP echo request over an unprivileged datagram socket.
+
+    Returns:
+        bool: Whether an echo reply arrived, or None if the platform does not
+        allow unprivileged ICMP sockets (caller should fall back to `ping`)
+    """
     try:
-        system = platform.system().lower()
-        if system == "windows":
-            cmd = ["ping", "-n", "1", "-w", "1000", ip]
-        else:
-            cmd = ["ping", "-c", "1", "-W", "1", ip]
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except AttributeError:
+        return None
+    except OSError as e:
+        if e.errno in _FD_EXHAUSTED_ERRNOS:
+            raise  # Falling back to `ping` would fail the same way and read as "offline"
+        return None
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=3)
-        return result.returncode == 0
-    except Exception:
+    # poll/epoll/kqueue rather than select(), which can't watch descriptors numbered 1024 or higher
+    selector = selectors.DefaultSelector()
+    try:
+        selector.register(sock, selectors.EVENT_READ)
+        ident = threading.get_ident() & 0xFFFF  # Linux rewrites this to the socket's port
+        sock.sendto(_icmp_echo_packet(ident, 1), (ip, 0))
+
+        deadline = time.monotonic() + timeout
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            if not selector.select(remaining):
+                return False
+            data, addr = sock.recvfrom(1024)
+            if addr[0] == ip and _is_echo_reply(data):
+                return True
+    except OSError:
         return False
+    finally:
+        selector.close()
+        sock.close()
+
+# Upper bound on echo requests per second during a sweep, so large subnets aren't blasted at line rate
+_ICMP_RATE = 2000
+
+def _icmp_sweep(ips, timeout=1.0, should_stop=None, on_progress=None):
+    """
+    Ping many hosts from one ICMP datagram socket: send every echo request, then
+    collect replies for `timeout` seconds, so a whole subnet costs about one RTT.
+
+    Args:
+        ips: Iterable of IP strings (consumed once)
+        timeout: Seconds to keep listening after the last request is sent
+        should_stop: Optional callable; once it returns True the sweep stops sending and
+            returns the replies seen so far
+        on_progress: Optional callable, called with the number of requests sent so far
 
-def check_device_status(ip):
-    """Check if a device is online, offline, or in standby."""
+    Returns:
+        set: IPs that answered, or None if unprivileged ICMP sockets are not
+        available (callers should ping hosts individually instead)
+    """
     try:
-        # First try ping
-        is_pingable = ping_host(ip)
+        sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM, socket.IPPROTO_ICMP)
+    except (OSError, AttributeError):
+        return None
 
-        if is_pingable:
-            return "online"
+    alive = set()
+    # Registered once with the platform's native poller (epoll/kqueue) instead of
+    # rebuilding a select() fd set on every wait
+    selector = selectors.DefaultSelector()
 
-        # If not pingable, check for common standby ports
-        standby_ports = [80, 443, 22, 23, 3389, 5900]  # HTTP, HTTPS, SSH, Telnet, RDP, VNC
+    def drain(wait):
+        # Read replies for up to `wait` seconds so the receive buffer doesn't overflow mid-sweep
+        deadline = time.monotonic() + wait
+        while True:
+            if not selector.select(max(0.0, deadline - time.monotonic())):
+                return
+            data, addr = sock.recvfrom(1024)
+            if _is_echo_reply(data):
+                alive.add(addr[0])
 
-        for port in standby_ports:
+    try:
+        selector.register(sock, selectors.EVENT_READ)
+        ident = threading.get_ident() & 0xFFFF
+        started = time.monotonic()
+        for seq, ip in enumerate(ips, 1):
             try:
+                sock.sendto(_icmp_echo_packet(ident, seq & 0xFFFF), (ip, 0))
+            except OSError:
+                pass  # Unroutable address - skip it, don't abort the sweep
+            if seq % 256 == 0:
+                if should_stop and should_stop():
+                    return alive
+                if on_progress:
+                    on_progress(seq)
+                # Pace to _ICMP_RATE, spending any slack collecting replies rather than sleeping
+                drain(max(0.0, started + seq / _ICMP_RATE - time.monotonic()))
+
+        drain(timeout)
+    except OSError:
+        pass
+    finally:
+        selector.close()
+        sock.close()
+    return alive
+
+def _tcp_probe(ip, ports, timeout=1.0):
+    """Return the first port in `ports` that accepts a TCP connection, or None.
+
+    All connects are started at once and waited on together, so the worst case
+    is a single `timeout` rather than one per port. At most _TCP_PROBE_SLOTS
+    probes hold sockets at any moment; the rest wait their turn.
+
+    Raises:
+        OSError: If the probe sockets can't be created (e.g. EMFILE) - the
+        host's state is unknown rather than closed
+    """
+    with _TCP_PROBE_SLOTS:
+        # poll/epoll/kqueue rather than select(), which can't watch descriptors numbered 1024 or higher
+        selector = selectors.DefaultSelector()
+        socks = []
+        try:
+            for port in ports:
                 sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                sock.settimeout(1)
-                result = sock.connect_ex((ip, port))
+                socks.append(sock)
+                sock.setblocking(False)
+                try:
+                    sock.connect_ex((ip, port))
+                except OSError:
+                    continue  # Unroutable from here - same as a closed port
+                selector.register(sock, selectors.EVENT_WRITE, port)
+
+            deadline = time.monotonic() + timeout
+            while selector.get_map():
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                events = selector.select(remaining)
+                if not events:
+                    break
+                for key, _ in events:
+                    selector.unregister(key.fileobj)
+                    # Writable with an error means refused/unreachable - keep waiting on the rest
+                    if key.fileobj.getsockopt(socket.SOL_SOCKET, socket.SO_ERROR) == 0:
+                        return key.data
+        finally:
+            selector.close()
+            for sock in socks:
                 sock.close()
-                if result == 0:
-                    return "standby"
-            except Exception:
-                continue
+    return None
+
+def ping_host(ip):
+    """Ping a host to check if it's alive."""
+    # Prefer an in-process ICMP echo; fork a `ping` only where that is not permitted
+    reachable = _icmp_echo(ip)
+    if reachable is not None:
+        return reachable
+
+    try:
+        # Only the exit status matters - don't pipe and decode ping's output
+        return subprocess.call(_PING_CMD + [ip], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=2) == 0
+    except Exception:
+        return False
+
+def check_device_status(ip, reachable=None):
+    """
+    Check if a device is online, offline, or in standby.
+
+    Args:
+        ip: Host to check
+        reachable: Ping result already known from a sweep, or None to ping now
+
+    Returns:
+        tuple: (status, open_port) - open_port is the standby port that answered,
+        or None when the host pinged or nothing answered
+    """
+    try:
+        # First try ping
+        if reachable is None:
+            reachable = ping_host(ip)
+        if reachable:
+            return "online", None
 
-        return "offline"
+        # If not pingable, check for common standby ports
+        open_port = _tcp_probe(ip, _STANDBY_PORTS)
+        if open_port is not None:
+            return "standby", open_port
+
+        return "offline", None
+    except OSError as e:
+        if e.errno in _FD_EXHAUSTED_ERRNOS:
+            # Don't report a host we couldn't probe as offline; let the scan skip it this pass
+            print(f"⚠️  Could not probe {ip}: {e}")
+            raise
+        return "offline", None
     except Exception:
-        return "offline"
+        return "offline", None
+
+# get_host_machine_info() is consulted for every device row the GUI draws
+_host_info_cache = {'t': 0.0, 'data': None}
+
+_iface_type_cache = {'t': 0.0, 'data': None}
+_iface_type_cache_lock = threading.Lock()
+
+def _classify_port_type(text):
+    """Map a system_profiler Type line or service name to WiFi/Ethernet/Thunderbolt, or None."""
+    if 'Wi-Fi' in text or 'WiFi' in text or 'AirPort' in text:
+        return "WiFi"
+    if 'Ethernet' in text:
+        return "Ethernet"
+    if 'Thunderbolt' in text:
+        return "Thunderbolt"
+    return None
+
+def _macos_interface_types(ttl=300.0):
+    """
+    Map BSD interface names to WiFi/Ethernet/Thunderbolt from one `system_profiler`
+    run, cached for `ttl` seconds (the command takes a second or more).
+
+    Returns:
+        dict: e.g. {'en0': 'WiFi', 'en5': 'Ethernet'}; empty if system_profiler failed
+    """
+    with _iface_type_cache_lock:
+        now = time.monotonic()
+        if _iface_type_cache['data'] is not None and now - _iface_type_cache['t'] < ttl:
+            return _iface_type_cache['data']
+
+        types = {}
+        try:
+            result = subprocess.run(['system_profiler', 'SPNetworkDataType'],
+                                    capture_output=True, text=True, timeout=10)
+            if result.returncode == 0:
+                # Each service is a block headed by "    Name:" (4-space indent) holding
+                # "Type: ..." and "BSD Device Name: enN" lines
+                service = port_type = device = None
+                for line in result.stdout.splitlines():
+                    stripped = line.strip()
+                    if not stripped:
+                        continue
+                    indent = len(line) - len(line.lstrip())
+                    if indent == 4 and stripped.endswith(':'):
+                        if device:
+                            types[device] = port_type or _classify_port_type(service)
+                        service, port_type, device = stripped[:-1], None, None
+                    elif stripped.startswith('Type:') and port_type is None and service:
+                        port_type = _classify_port_type(stripped)
+                    elif stripped.startswith('BSD Device Name:') and device is None and service:
+                        device = stripped.split(':', 1)[1].strip()
+                if device:
+                    types[device] = port_type or _classify_port_type(service)
+                types = {name: kind for name, kind in types.items() if kind}
+        except Exception:
+            pass
+
+        _iface_type_cache['t'] = now
+        _iface_type_cache['data'] = types
+        return types
+
+# Interface-name fallbacks when the system can't say what an adapter is. On macOS en0 is
+# typically built-in WiFi and en1 Ethernet; elsewhere those names carry no meaning.
+_IFACE_PREFIX_RE = re.compile(r'en0|en1|wlan|eth|lo')
+_IFACE_PREFIX_TYPES = {'wlan': "WiFi", 'eth': "Ethernet", 'lo': "Loopback"}
+_IFACE_PREFIX_TYPES_MACOS = dict(_IFACE_PREFIX_TYPES, en0="WiFi", en1="Ethernet")
+
+def _interface_type_from_name(interface_name, prefix_types=_IFACE_PREFIX_TYPES):
+    """Guess an adapter type from its name prefix, or "Network" if it doesn't match."""
+    match = _IFACE_PREFIX_RE.match(interface_name)
+    return prefix_types.get(match.group(), "Network") if match else "Network"
+
+def get_host_machine_info(ttl=30.0):
+    """Get the host machine's network information and system name (cached for `ttl` seconds)."""
+    now = time.monotonic()
+    cached = _host_info_cache['data']
+    if cached is not None and now - _host_info_cache['t'] < ttl:
+        return cached
 
-def get_host_machine_info():
-    """Get the host machine's network information and system name."""
     try:
         # Get the hostname
         hostname = platform.node()
@@ -464,41 +863,29 @@ def get_host_machine_info():
         # Get local IP addresses from all network interfaces
         local_ips = []
         try:
-            # Get IPs from all network interfaces (same method as get_network_interfaces)
-            for interface_name in netifaces.interfaces():
-                try:
-                    # Skip loopback interfaces
-                    if interface_name.startswith('lo') or 'Loopback' in interface_name:
-                        continue
-
-                    addrs = netifaces.ifaddresses(interface_name)
-
-                    # Check for IPv4 addresses
-                    if netifaces.AF_INET in addrs:
-                        for addr_info in addrs[netifaces.AF_INET]:
-                            ip = addr_info.get('addr')
-                            if ip and ip != '127.0.0.1':
-                                local_ips.append(ip)
-                except Exception:
-                    continue
+            # Get IPs from all network interfaces (same enumeration as get_network_interfaces)
+            for interface_name, ipv4_addrs in _cached_interfaces():
+                local_ips.extend(ip for ip, netmask in ipv4_addrs)
         except Exception:
             pass
 
         # Also try to get IP from socket as fallback
         try:
-            s = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
-            s.connect(("8.8.8.8", 80))
-            local_ip = s.getsockname()[0]
-            s.close()
+            with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+                s.connect(("8.8.8.8", 80))
+                local_ip = s.getsockname()[0]
             if local_ip not in local_ips:
                 local_ips.append(local_ip)
         except Exception:
             pass
 
-        return {
+        info = {
             'hostname': hostname,
             'local_ips': local_ips
         }
+        _host_info_cache['t'] = now
+        _host_info_cache['data'] = info
+        return info
     except Exception as e:
         print(f"Error getting host machine info: {e}")
         return {'hostname': 'Unknown', 'local_ips': []}
@@ -506,20 +893,18 @@ def get_host_machine_info():
 def get_mac_address(ip):
     """Get MAC address for an IP using improved ARP method with automatic padding."""
     try:
-        system = platform.system().lower()
-        if system == "windows":
+        if _SYSTEM == "Windows":
             cmd = ["arp", "-a", ip]
         else:
             # On macOS/Linux, try arp -n <ip> first, then fall back to arp -a
             cmd = ["arp", "-n", ip]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=2)
         if result.returncode == 0 and result.stdout.strip():
             output = result.stdout
             # Look for MAC address in the output
             # Handle both formats: 0:3e:e1:b7:57:54 and 00-3e-e1-b7-57-54
-            mac_pattern = r'([0-9a-fA-F]{1,2}[:-]){5}[0-9a-fA-F]{1,2}'
-            match = re.search(mac_pattern, output, re.IGNORECASE)
+            match = _MAC_RE.search(output)
             if match:
                 mac = match.group(0).upper().replace('-', ':')
                 # Apply MAC padding rule: pad with leading zeros to reach 12 characters
@@ -530,14 +915,13 @@ def get_mac_address(ip):
 
     # Fallback: try arp -a and search for the IP
     try:
-        result = subprocess.run(["arp", "-a"], capture_output=True, text=True, timeout=2)
+        result = subprocess.run(["arp", "-a"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=2)
         if result.returncode == 0:
             output = result.stdout
             if ip in output:
                 for line in output.split('\n'):
                     if ip in line:
-                        mac_pattern = r'([0-9a-fA-F]{1,2}[:-]){5}[0-9a-fA-F]{1,2}'
-                        mac_match = re.search(mac_pattern, line)
+                        mac_match = _MAC_RE.search(line)
                         if mac_match:
                             mac = mac_match.group(0).upper().replace('-', ':')
                             # Apply MAC padding rule: pad with leading zeros to reach 12 characters
@@ -548,6 +932,75 @@ def get_mac_address(ip):
 
     return None
 
+def _read_arp_entries():
+    """
+    Read the ARP cache on Linux/macOS without per-host subprocesses.
+
+    Linux exposes the table in /proc/net/arp (no fork at all); macOS needs a
+    single `arp -an`, parsed in one regex pass.
+
+    Returns:
+        list: [(ip, mac, interface_name), ...] for resolved entries
+    """
+    entries = []
+    if _SYSTEM == 'Linux' and os.path.exists('/proc/net/arp'):
+        with open('/proc/net/arp', 'r') as f:
+            next(f, None)  # Header: IP address, HW type, Flags, HW address, Mask, Device
+            for line in f:
+                fields = line.split()
+                # Flags 0x0 marks an incomplete (unresolved) entry
+                if len(fields) >= 6 and fields[2] != '0x0':
+                    entries.append((fields[0], fields[3].upper(), fields[5]))
+    else:
+        result = subprocess.run(['arp', '-an'], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5)
+        if result.returncode == 0:
+            for match in _ARP_ENTRY_RE.finditer(result.stdout):
+                entries.append((match.group(1), match.group(2).upper(), match.group(3)))
+    return entries
+
+def _read_arp_neighbors(interface_name, arp_entries=None):
+    """Yield the IPs the ARP cache has resolved on `interface_name`."""
+    if arp_entries is None:
+        arp_entries = _read_arp_entries()
+    for ip, mac, entry_interface in arp_entries:
+        if entry_interface == interface_name:
+            yield ip
+
+def build_arp_table():
+    """
+    Read the system ARP cache with a single `arp` call.
+
+    Returns:
+        dict: IP address -> padded MAC address for every resolved neighbor
+    """
+    arp_table = {}
+    try:
+        if _SYSTEM in ('Darwin', 'Linux'):
+            for ip, mac, interface_name in _read_arp_entries():
+                arp_table[ip] = pad_mac_address(mac)
+            return arp_table
+
+        result = subprocess.run(["arp", "-a"], stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=5)
+        if result.returncode == 0:
+            for line in result.stdout.split('\n'):
+                mac_match = _MAC_RE.search(line)
+                ip_match = _IPV4_RE.search(line)
+                if mac_match and ip_match:
+                    try:
+                        ip = str(ipaddress.IPv4Address(ip_match.group(0)))
+                    except ValueError:
+                        continue
+                    mac = mac_match.group(0).upper().replace('-', ':')
+                    arp_table[ip] = pad_mac_address(mac)
+    except Exception:
+        pass
+
+    return arp_table
+
+def _fmt_mac(hex12):
+    """Format 12 hex digits as colon-separated octets."""
+    return ':'.join(hex12[i:i+2] for i in range(0, 12, 2))
+
 def pad_mac_address(mac_address):
     """
     Apply the MAC padding rule: pad with leading zeros to reach 12 characters.
@@ -556,30 +1009,111 @@ def pad_mac_address(mac_address):
     if not mac_address:
         return mac_address
 
+    # Already canonical (aa:bb:cc:dd:ee:ff) - nothing to rebuild
+    if len(mac_address) == 17 and mac_address.count(':') == 5 and '-' not in mac_address:
+        return mac_address
+
     # Remove separators and count characters
     clean_mac = mac_address.replace(':', '').replace('-', '')
     current_length = len(clean_mac)
 
     if current_length == 12:
         # Already correct length, just format with colons
-        return ':'.join([clean_mac[i:i+2] for i in range(0, 12, 2)])
+        return _fmt_mac(clean_mac)
     elif current_length < 12:
         # Pad with leading zeros
         needed_zeros = 12 - current_length
-        padded_mac = '0' * needed_zeros + clean_mac
-
-        # Format with colons
-        formatted_mac = ':'.join([padded_mac[i:i+2] for i in range(0, 12, 2)])
+        formatted_mac = _fmt_mac('0' * needed_zeros + clean_mac)
 
-        print(f"🔧 MAC padding applied:")
-        print(f"   {mac_address} → {formatted_mac} (added {needed_zeros} leading zeros)")
+        # Runs for every short MAC on every scan, so only narrate it in debug mode
+        if _DEBUG:
+            print(f"🔧 MAC padding applied:")
+            print(f"   {mac_address} → {formatted_mac} (added {needed_zeros} leading zeros)")
         return formatted_mac
     else:
         # More than 12 characters - may god have mercy on their souls
         print(f"⚠️  MAC address {mac_address} has {current_length} characters - truncating to 12")
-        truncated_mac = clean_mac[:12]
-        formatted_mac = ':'.join([truncated_mac[i:i+2] for i in range(0, 12, 2)])
-        return formatted_mac
+        return _fmt_mac(clean_mac[:12])
+
+# OUI prefix (6 hex digits, no separators) -> vendor, loaded on first lookup
+_OUI = None
+_oui_lock = threading.Lock()
+
+# Fallback vendors for prefixes missing from the OUI database
+_COMMON_VENDORS = {
+    "005056": "VMware",
+    "000C29": "VMware",
+    "001A11": "Google",
+    "00163E": "Xen",
+    "525400": "QEMU",
+    "080027": "VirtualBox",
+    "0EC663": "ASIX ELECTRONICS CORP."  # From our testing!
+}
+
+def _parse_oui_text(oui_file):
+    """Parse the tab-separated OUI text database into a prefix -> vendor dict."""
+    oui = {}
+    # Walk the file as raw bytes and only decode the fields we keep
+    with open(oui_file, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        for line in iter(mm.readline, b''):
+            # Format: MAC_PREFIX\tVENDOR_NAME
+            if line[:1] == b'#':
+                continue
+            parts = line.split(b'\t', 1)
+            if len(parts) == 2:
+                vendor = parts[1].strip()
+                if vendor:
+                    oui[parts[0].strip().upper().decode('ascii', 'ignore')] = vendor.decode('utf-8', 'ignore')
+    return oui
+
+def build_oui_index(oui_file=_OUI_PATH, index_file=_OUI_INDEX_PATH):
+    """
+    Pre-parse the OUI text database into a pickled dict for fast startup.
+
+    Run at build time (see `make oui-index`); the index is optional and the
+    text database is used whenever it is missing or older than the text file.
+
+    Returns:
+        int: Number of prefixes written
+    """
+    oui = _parse_oui_text(oui_file)
+    with open(index_file, 'wb') as f:
+        pickle.dump(oui, f, protocol=pickle.HIGHEST_PROTOCOL)
+    return len(oui)
+
+def _load_oui():
+    """Load the OUI database once into a prefix -> vendor dict."""
+    global _OUI
+    with _oui_lock:
+        if _OUI is not None:
+            return _OUI
+
+        oui = None
+        # Prefer the prebuilt pickle, as long as it isn't stale relative to the text file
+        try:
+            if (os.path.exists(_OUI_INDEX_PATH) and
+                    (not os.path.exists(_OUI_PATH) or
+                     os.path.getmtime(_OUI_INDEX_PATH) >= os.path.getmtime(_OUI_PATH))):
+                with open(_OUI_INDEX_PATH, 'rb') as f:
+                    oui = pickle.load(f)
+                if not isinstance(oui, dict):
+                    oui = None
+        except Exception:
+            oui = None  # Unreadable or written by a newer pickle protocol - parse the text instead
+
+        if oui is None:
+            oui = {}
+            if os.path.exists(_OUI_PATH):
+                try:
+                    oui = _parse_oui_text(_OUI_PATH)
+                except Exception as e:
+                    print(f"⚠️  OUI database read error: {e}")
+
+        for prefix, vendor in _COMMON_VENDORS.items():
+            oui.setdefault(prefix, vendor)
+
+        _OUI = oui
+        return _OUI
 
 def get_mac_vendor(mac_address, silent=False):
     """
@@ -597,66 +1131,127 @@ def get_mac_vendor(mac_address, silent=False):
         if not mac_address or len(mac_address.split(':')) < 3:
             return None
 
-        # Extract first 6 characters (OUI) and convert to database format
-        mac_prefix = ":".join(mac_address.split(":")[:3]).upper()
-        # Convert to database format (remove colons): 0:3E:E1 -> 03E1
-        db_prefix = mac_prefix.replace(":", "").upper()
-
-        # Try to find vendor in OUI database
-        oui_file = os.path.join(os.path.dirname(__file__), 'assets', 'oui_database.txt')
-
-        if os.path.exists(oui_file):
-            try:
-                with open(oui_file, 'r', encoding='utf-8', errors='ignore') as f:
-                    for line in f:
-                        line = line.strip()
-                        if line and db_prefix in line:
-                            # Extract vendor name from the line
-                            # Format: MAC_PREFIX\tVENDOR_NAME
-                            parts = line.split('\t')
-                            if len(parts) >= 2:
-                                vendor = parts[1].strip()
-                                if vendor:
-                                    if not silent:
-                                        print(f"🏭 Found vendor via OUI database: {vendor}")
-                                    return vendor
-            except Exception as e:
-                print(f"⚠️  OUI database read error: {e}")
-
-        # Fallback to hardcoded common vendors
-        common_vendors = {
-            "00:50:56": "VMware",
-            "00:0C:29": "VMware",
-            "00:1A:11": "Google",
-            "00:16:3E": "Xen",
-            "52:54:00": "QEMU",
-            "08:00:27": "VirtualBox",
-            "0E:C6:63": "ASIX ELECTRONICS CORP."  # From our testing!
-        }
-
-        if mac_prefix in common_vendors:
-            return common_vendors[mac_prefix]
+        # Extract the OUI in database format (no colons, each octet two digits): 0:3E:E1 -> 003EE1
+        db_prefix = "".join(part.zfill(2) for part in mac_address.split(":")[:3]).upper()
 
-        return None
+        vendor = _load_oui().get(db_prefix)
+        if vendor and not silent:
+            print(f"🏭 Found vendor via OUI database: {vendor}")
+        return vendor
 
     except Exception as e:
         print(f"❌ MAC vendor lookup failed: {e}")
     return None
 
-def get_device_identifier(ip):
-    """Get comprehensive device identifier information using multiple discovery methods."""
+@functools.lru_cache(maxsize=4096)
+def _vendor_for_oui(oui):
+    """Vendor for a normalized OUI such as "00:3E:E1", memoized since the OUI table doesn't change at runtime."""
+    return get_mac_vendor(oui + ":00:00:00", silent=True)
+
+def _cached_vendor(mac_address):
+    """Silent get_mac_vendor() that shares one cache entry across every MAC with the same OUI."""
+    if not mac_address:
+        return None
+    parts = mac_address.replace("-", ":").split(":")
+    if len(parts) < 3:
+        return None
+    return _vendor_for_oui(":".join(part.zfill(2) for part in parts[:3]).upper())
+
+# gethostbyaddr() has no timeout of its own and the system resolver can block for
+# seconds, so lookups run on a small side pool and callers only wait briefly
+_dns_pool = ThreadPoolExecutor(max_workers=16, thread_name_prefix="wol-rdns")
+
+# ip -> (expires_at, hostname or None). Misses outlive a few 30s scan cycles so hosts with
+# no PTR record aren't looked up again every pass, but a new record is still picked up
+_dns_cache = {}
+_dns_cache_lock = threading.Lock()
+# ip -> gethostbyaddr() future still running or queued, so callers that time out don't pile up repeats
+_dns_pending = {}
+_DNS_TTL = 3600.0
+_DNS_NEGATIVE_TTL = 120.0
+
+def _store_reverse_dns(ip, future):
+    """Cache the outcome of a finished gethostbyaddr() future, even one the caller stopped waiting for."""
     try:
-        # Method 1: Try to get hostname via standard DNS resolution
+        hostname = future.result()[0]
+    except Exception:
+        hostname = None
+    ttl = _DNS_TTL if hostname else _DNS_NEGATIVE_TTL
+    with _dns_cache_lock:
+        _dns_cache[ip] = (time.monotonic() + ttl, hostname)
+        if _dns_pending.get(ip) is future:
+            del _dns_pending[ip]
+
+def _reverse_dns(ip, timeout=0.5):
+    """Reverse-resolve `ip`, giving up after `timeout` seconds. Returns the hostname or None."""
+    try:
+        submitted = False
+        with _dns_cache_lock:
+            cached = _dns_cache.get(ip)
+            if cached is not None and time.monotonic() < cached[0]:
+                return cached[1]
+            # Wait on a lookup that's already queued rather than adding another behind it
+            future = _dns_pending.get(ip)
+            if future is None:
+                future = _dns_pending[ip] = _dns_pool.submit(socket.gethostbyaddr, ip)
+                submitted = True
+
+        if submitted:
+            # Outside the lock: an already-finished future runs the callback right here
+            future.add_done_callback(lambda f: _store_reverse_dns(ip, f))
+        return future.result(timeout=timeout)[0]
+    except Exception:
+        return None
+
+def forget_reverse_dns(ip):
+    """Drop the cached name for `ip`, e.g. when a different MAC now answers there."""
+    with _dns_cache_lock:
+        _dns_cache.pop(ip, None)
+
+# ip -> (checked_at, first open service port or None); scans repeat every cycle, services rarely change
+_service_port_cache = {}
+_service_port_cache_lock = threading.Lock()
+_SERVICE_PORT_TTL = 300.0
+
+def _probe_service_port(ip, timeout=0.5):
+    """Return the first port in _SERVICE_NAMES accepting connections on `ip`, remembered for a few minutes."""
+    now = time.monotonic()
+    with _service_port_cache_lock:
+        cached = _service_port_cache.get(ip)
+    if cached is not None and now - cached[0] < _SERVICE_PORT_TTL:
+        return cached[1]
+
+    open_port = None
+    for port in _SERVICE_NAMES:
         try:
-            hostname = socket.gethostbyaddr(ip)[0]
+            with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+                sock.settimeout(timeout)
+                if sock.connect_ex((ip, port)) == 0:
+                    open_port = port
+                    break
+        except Exception:
+            continue
+
+    with _service_port_cache_lock:
+        _service_port_cache[ip] = (now, open_port)
+    return open_port
+
+def get_device_identifier(ip, status="online", open_port=None):
+    """Get comprehensive device identifier information using multiple discovery methods.
+
+    `open_port` is the port check_device_status() already found open; when given,
+    the service scan (Method 4) reuses it instead of probing the host again.
+    """
+    try:
+        # Method 1: Try to get hostname via standard DNS resolution (only worth it for hosts answering ping)
+        if status == "online":
+            hostname = _reverse_dns(ip)
             if hostname and hostname != ip and len(hostname) > 2:
                 return hostname
-        except Exception:
-            pass
 
         # Method 2: Try to get Windows NetBIOS name via smbutil (macOS only)
         try:
-            if platform.system() == 'Darwin':  # Only on macOS
+            if _SYSTEM == 'Darwin':  # Only on macOS
                 netbios_name = get_netbios_name_smbutil(ip)
                 if netbios_name:
                     return netbios_name
@@ -665,7 +1260,7 @@ def get_device_identifier(ip):
 
         # Method 3: Try to get Apple device name via mDNS/Bonjour (macOS only)
         try:
-            if platform.system() == 'Darwin':  # Only on macOS
+            if _SYSTEM == 'Darwin':  # Only on macOS
                 apple_device_name = get_apple_device_name(ip)
                 if apple_device_name:
                     return apple_device_name
@@ -674,28 +1269,12 @@ def get_device_identifier(ip):
 
         # Method 4: Try to get additional device information via service detection
         try:
-            # Check for common service names
-            service_ports = {
-                22: "SSH",
-                23: "Telnet",
-                80: "HTTP",
-                443: "HTTPS",
-                3389: "RDP",
-                5900: "VNC",
-                8080: "HTTP-Alt",
-                8443: "HTTPS-Alt"
-            }
+            if open_port in _SERVICE_NAMES:
+                return f"{_SERVICE_NAMES[open_port]}-{ip.split('.')[-1]}"
 
-            for port, service in service_ports.items():
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.5)
-                    result = sock.connect_ex((ip, port))
-                    sock.close()
-                    if result == 0:
-                        return f"{service}-{ip.split('.')[-1]}"
-                except Exception:
-                    continue
+            port = _probe_service_port(ip, timeout=0.5)
+            if port is not None:
+                return f"{_SERVICE_NAMES[port]}-{ip.split('.')[-1]}"
         except Exception:
             pass
 
@@ -704,7 +1283,7 @@ def get_device_identifier(ip):
             mac = get_mac_address(ip)
             if mac:
                 # Use our breakthrough OUI database lookup method!
-                vendor = get_mac_vendor(mac, silent=True)
+                vendor = _cached_vendor(mac)
                 if vendor:
                     return f"{vendor}-{ip.split('.')[-1]}"
         except Exception:
@@ -717,166 +1296,157 @@ def get_device_identifier(ip):
         # Fallback to last octet
         return f".{ip.split('.')[-1]}"
 
-def scan_network_for_devices_live(interface_info, live_callback=None, known_devices=None, progress_callback=None):
-    """Scan a network for active devices with live updates."""
-    try:
-        network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
-        host_ips = [str(ip) for ip in network.hosts()]
-
-        # Chunked scanning for large networks
-        chunk_size = 255  # Process networks in 255-address chunks
-        total_ips = len(host_ips)
-
-        devices = []
-        scanned = 0
-
-        # Initialize with known devices if provided
-        if known_devices:
-            devices.extend(known_devices)
-
-        def scan_ip(ip):
-            nonlocal scanned
-            # Call progress callback to show current IP being scanned
-            if progress_callback:
-                try:
-                    progress_callback(f"Scrying {interface_info['interface']} - {ip}")
-                except Exception:
-                    pass
-
-            status = check_device_status(ip)
-            hostname = None
-            mac_address = None
-
-            if status in ["online", "standby"]:
-                hostname = get_device_identifier(ip)
-                mac_address = get_mac_address(ip)
-
-            # Check if this device was previously known
-            known_device = None
-            if known_devices:
-                for known in known_devices:
-                    if known['ip'] == ip:
-                        known_device = known
-                        break
+_pack_u32 = struct.Struct('!I').pack
 
-            # Determine status and hostname
-            if status in ["online", "standby"]:
-                # Use discovered hostname or last known hostname
-                display_hostname = hostname or (known_device['hostname'] if known_device else f".{ip.split('.')[-1]}")
-            else:
-                # If no known devices (history was cleared), don't show offline devices
-                if not known_devices:
-                    status = "hidden"
-                    display_hostname = None
-                elif known_device:
-                    # Previously discovered device that's now offline
-                    display_hostname = known_device['hostname']
-                else:
-                    # Never discovered device - hide it
-                    status = "hidden"
-                    display_hostname = None
+def _iter_host_ips(network):
+    """
+    Iterate the same addresses as network.hosts(), as strings, without building an
+    IPv4Address object per host (several times faster on large subnets).
+    """
+    first = int(network.network_address)
+    last = int(network.broadcast_address)
+    # /31 and /32 have no network/broadcast address to exclude
+    if network.prefixlen < 31:
+        first += 1
+        last -= 1
+    return map(socket.inet_ntoa, map(_pack_u32, range(first, last + 1)))
+
+def _host_count(network):
+    """Number of addresses network.hosts() yields, without enumerating them."""
+    # /31 and /32 have no network/broadcast address to exclude
+    return network.num_addresses - 2 if network.prefixlen < 31 else network.num_addresses
+
+# Address ranges the device tree always groups as their own network, whatever interface found them
+_NETWORK_RULES = [
+    (int(n.network_address), int(n.broadcast_address), str(n))
+    for n in map(ipaddress.IPv4Network, ('192.168.0.0/24', '134.124.230.0/24', '134.124.231.0/24'))
+]
+
+_unpack_u32 = struct.Struct('!I').unpack
+
+def _classify_network(ip, fallback):
+    """Network key from _NETWORK_RULES that `ip` falls in, or `fallback` if none (or `ip` is malformed)."""
+    try:
+        ip_int = _unpack_u32(socket.inet_aton(ip))[0]
+    except (OSError, TypeError):
+        return fallback
+    for lo, hi, key in _NETWORK_RULES:
+        if lo <= ip_int <= hi:
+            return key
+    return fallback
+
+@functools.lru_cache(maxsize=256)
+def _network_range_display(subnet_str):
+    """Range label for a network row in the device tree, memoized per subnet string."""
+    # Use standard network notation (.0 for network address)
+    if subnet_str == '192.168.0.0/24':
+        return "192.168.0.0"
+    if subnet_str == '134.124.230.0/24':
+        return "134.124.230.0"
+    try:
+        network = ipaddress.IPv4Network(subnet_str, strict=False)
+        # Fallback to original format for other networks
+        return f"{network.network_address} - {network.broadcast_address}"
+    except Exception:
+        return subnet_str
 
-            device = {
-                'ip': ip,
-                'hostname': display_hostname,
-                'mac': mac_address or (known_device['mac'] if known_device else None),
-                'status': status,
-                'pingable': status == "online",
-                'last_seen': time.time() if status in ["online", "standby"] else (known_device.get('last_seen', 0) if known_device else 0)
-            }
+def _ip_sort_key(device):
+    """Sort key ordering devices numerically by IP: the packed address compares as one C-level bytes compare."""
+    return socket.inet_aton(device['ip'])
 
-            scanned += 1
+# Shared result for offline hosts with no history; callers drop anything marked hidden
+_HIDDEN_DEVICE = {'status': 'hidden'}
 
-            return device
+# Seconds a scan allows per round of `workers` hosts before dropping stragglers
+_SCAN_ROUND_TIMEOUT = 4
 
-        # Process in chunks to allow other networks to be scanned
-        for chunk_start in range(0, total_ips, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, total_ips)
-            chunk_ips = host_ips[chunk_start:chunk_end]
+def _scan_timeout(n_hosts, workers=SCAN_MAX_WORKERS):
+    """Time budget for probing `n_hosts` hosts, `workers` at a time, on the shared pool."""
+    rounds = -(-n_hosts // workers)
+    return _SCAN_ROUND_TIMEOUT * max(1, rounds)
 
-            # Use ThreadPoolExecutor for concurrent scanning within chunk
-            with ThreadPoolExecutor(max_workers=20) as executor:
-                device_futures = [executor.submit(scan_ip, ip) for ip in chunk_ips]
+def scan_network(interface_info, *, live_callback=None, progress_callback=None, completed_callback=None,
+                 known_devices=None, max_workers=SCAN_MAX_WORKERS, arp_table=None, should_stop=None):
+    """
+    Scan a network for active devices.
 
-                # Process devices as they complete and call live callback immediately
-                for future in device_futures:
-                    try:
-                        device = future.result(timeout=3)
-                        if device['status'] != "hidden":  # Only include non-hidden devices
-                            # Check for duplicates and update existing entries
-                            existing_device = None
-                            for existing in devices:
-                                if existing['ip'] == device['ip']:
-                                    existing_device = existing
-                                    break
-
-                            if existing_device:
-                                # Update existing device with new status
-                                existing_device.update(device)
-                            else:
-                                # Add new device
-                                devices.append(device)
-
-                            # Call live callback immediately for this individual device
-                            if live_callback:
-                                try:
-                                    live_callback(device, interface_info['interface'])
-                                except Exception as e:
-                                    print(f"Error in live callback for {device['ip']}: {e}")
-                    except Exception:
-                        scanned += 1
-                        continue
+    Args:
+        interface_info: Interface dict from get_network_interfaces()
+        live_callback: Called as live_callback(device, interface) for each visible device as it is found
+        progress_callback: Called with a status message naming the IP being scanned
+        completed_callback: Called as completed_callback(completed, total) after each batch of finished hosts
+        known_devices: Previously discovered devices, kept (as offline) when they don't answer
+        max_workers: Upper bound on hosts probed at once
+        arp_table: Optional build_arp_table() snapshot; taken here if not given
+        should_stop: Optional callable; once it returns True no more hosts are probed and
+            the devices found so far are returned. Hosts still unanswered after
+            _scan_timeout() are dropped the same way
 
-            # Small delay between chunks to allow other networks to process
-            if chunk_end < total_ips:
-                time.sleep(0.1)
+    Returns:
+        list: Visible devices, known ones first
+    """
+    try:
+        network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
 
-        return devices
+        # One ARP snapshot per pass; only hosts missing from it need their own `arp` call
+        if arp_table is None:
+            arp_table = build_arp_table()
 
-    except Exception:
-        return []
+        # Hosts are generated on demand so a /16 doesn't build 65k strings before the first probe
+        host_iter = _iter_host_ips(network)
+        total_ips = _host_count(network)
 
-def scan_network_for_devices(interface_info, progress_callback=None, known_devices=None):
-    """Scan a network for active devices with enhanced discovery and chunked scanning."""
-    try:
-        network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
-        host_ips = [str(ip) for ip in network.hosts()]
+        def report_sweep(sent):
+            if progress_callback:
+                try:
+                    progress_callback(f"Scrying {interface_info['interface']} - pinged {sent}/{total_ips}")
+                except Exception:
+                    pass
 
-        # Chunked scanning for large networks
-        chunk_size = 255  # Process networks in 255-address chunks
-        total_ips = len(host_ips)
+        # Ping the whole subnet from one socket up front; workers then only do the TCP/ARP/name work
+        alive = _icmp_sweep(_iter_host_ips(network), should_stop=should_stop, on_progress=report_sweep)
 
         devices = []
-        scanned = 0
+        # next() on a count is atomic under the GIL, so workers can share it without a lock
+        started = itertools.count(1)
+
+        # Index devices by IP so per-host lookups don't rescan the history lists
+        known_by_ip = {d['ip']: d for d in (known_devices or [])}
+        devices_by_ip = {}
 
         # Initialize with known devices if provided
-        if known_devices:
-            devices.extend(known_devices)
+        for known in (known_devices or []):
+            if known['ip'] not in devices_by_ip:
+                devices_by_ip[known['ip']] = known
+                devices.append(known)
 
         def scan_ip(ip):
-            nonlocal scanned
-            # Call progress callback to show current IP being scanned
-            if progress_callback:
+            # Show the IP being scanned, throttled so the GUI isn't handed one update per host
+            n = next(started)
+            if progress_callback and (n == 1 or n % 16 == 0 or n == total_ips):
                 try:
                     progress_callback(f"Scrying {interface_info['interface']} - {ip}")
                 except Exception:
                     pass
 
-            status = check_device_status(ip)
+            status, open_port = check_device_status(ip, None if alive is None else ip in alive)
+
+            # Check if this device was previously known
+            known_device = known_by_ip.get(ip)
+
+            # Offline and never seen before: the result would be discarded, so skip building it
+            if status not in ("online", "standby") and not known_device:
+                return _HIDDEN_DEVICE
+
             hostname = None
             mac_address = None
 
             if status in ["online", "standby"]:
-                hostname = get_device_identifier(ip)
-                mac_address = get_mac_address(ip)
-
-            # Check if this device was previously known
-            known_device = None
-            if known_devices:
-                for known in known_devices:
-                    if known['ip'] == ip:
-                        known_device = known
-                        break
+                mac_address = arp_table.get(ip) or get_mac_address(ip)
+                # A different MAC at a known IP means a different machine - don't reuse its cached name
+                if mac_address and known_device and known_device.get('mac') and known_device['mac'].upper() != mac_address.upper():
+                    forget_reverse_dns(ip)
+                hostname = get_device_identifier(ip, status, open_port)
 
             # Determine status and hostname
             if status in ["online", "standby"]:
@@ -904,55 +1474,69 @@ def scan_network_for_devices(interface_info, progress_callback=None, known_devic
                 'last_seen': time.time() if status in ["online", "standby"] else (known_device.get('last_seen', 0) if known_device else 0)
             }
 
-            scanned += 1
-            if progress_callback:
-                try:
-                    progress_callback(scanned, total_ips, interface_info['interface'])
-                except Exception:
-                    pass
-
             return device
 
-        # Process in chunks to allow other networks to be scanned
-        for chunk_start in range(0, total_ips, chunk_size):
-            chunk_end = min(chunk_start + chunk_size, total_ips)
-            chunk_ips = host_ips[chunk_start:chunk_end]
+        # Scan every host through one pool so total time tracks the slowest hosts, not the sum
+        workers = max(1, min(max_workers, total_ips))
+        executor = _SCAN_POOL
+        # Keep a bounded window of hosts in flight and top it up as probes finish
+        pending = set()
+        completed = 0
+        deadline = time.monotonic() + _scan_timeout(total_ips, workers)
+        if not (should_stop and should_stop()):
+            for ip in host_iter:
+                pending.add(executor.submit(scan_ip, ip))
+                if len(pending) >= workers * 4:
+                    break
+
+        # Process devices as they complete and call live callback immediately
+        while pending:
+            done, pending = wait(pending, timeout=max(0.0, deadline - time.monotonic()),
+                                 return_when=FIRST_COMPLETED)
+            if (should_stop and should_stop()) or time.monotonic() >= deadline:
+                # Drop hosts that haven't started; the ones already running finish on their own
+                for future in pending:
+                    future.cancel()
+                pending = set()
+                host_iter = iter(())
+            for ip in host_iter:
+                pending.add(executor.submit(scan_ip, ip))
+                if len(pending) >= workers * 4:
+                    break
 
-            # Use ThreadPoolExecutor for concurrent scanning within chunk
-            with ThreadPoolExecutor(max_workers=20) as executor:
-                device_futures = [executor.submit(scan_ip, ip) for ip in chunk_ips]
+            for future in done:
+                try:
+                    device = future.result()
+                    if device['status'] != "hidden":  # Only include non-hidden devices
+                        # Check for duplicates and update existing entries
+                        existing_device = devices_by_ip.get(device['ip'])
+
+                        if existing_device:
+                            # Update existing device with new status
+                            existing_device.update(device)
+                        else:
+                            # Add new device
+                            devices_by_ip[device['ip']] = device
+                            devices.append(device)
 
-                for future in device_futures:
-                    try:
-                        device = future.result(timeout=3)
-                        if device['status'] != "hidden":  # Only include non-hidden devices
-                            # Check for duplicates and update existing entries
-                            existing_device = None
-                            for existing in devices:
-                                if existing['ip'] == device['ip']:
-                                    existing_device = existing
-                                    break
-
-                            if existing_device:
-                                # Update existing device with new status
-                                existing_device.update(device)
-                            else:
-                                # Add new device
-                                devices.append(device)
-                    except Exception:
-                        scanned += 1
-                        if progress_callback:
+                        # Call live callback immediately for this individual device
+                        if live_callback:
                             try:
-                                progress_callback(scanned, total_ips, interface_info['interface'])
-                            except Exception:
-                                pass
-                        continue
+                                live_callback(device, interface_info['interface'])
+                            except Exception as e:
+                                print(f"Error in live callback for {device['ip']}: {e}")
+                except Exception:
+                    continue
 
-            # Small delay between chunks to allow other networks to process
-            if chunk_end < total_ips:
-                time.sleep(0.1)
+            completed += len(done)
+            if completed_callback:
+                try:
+                    completed_callback(completed, total_ips)
+                except Exception:
+                    pass
 
         return devices
+
     except Exception:
         return []
 
@@ -976,8 +1560,9 @@ def format_network_range(subnet_str):
     except Exception:
         return subnet_str
 
+@functools.lru_cache(maxsize=1024)
 def create_magic_packet(mac_address=None):
-    """Create a Wake-on-LAN magic packet."""
+    """Create a Wake-on-LAN magic packet (memoized per MAC; the returned bytes are immutable)."""
     try:
         if mac_address:
             # Clean and validate MAC address
@@ -998,22 +1583,86 @@ def create_magic_packet(mac_address=None):
         print(f"❌ Error creating magic packet: {e}")
         return None
 
+# One broadcast-enabled UDP socket shared by every send; sendto() is safe to call from
+# several threads, and the routing table picks the interface for each destination
+_broadcast_sock = None
+_broadcast_sock_lock = threading.Lock()
+
+def _get_broadcast_socket():
+    """Return the shared SO_BROADCAST UDP socket, creating it on first use."""
+    global _broadcast_sock
+    with _broadcast_sock_lock:
+        if _broadcast_sock is None or _broadcast_sock.fileno() == -1:
+            sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
+            sock.setblocking(False)
+            _broadcast_sock = sock
+        return _broadcast_sock
+
+# Common WOL ports
+_WOL_PORTS = (7, 9)
+
+def _send_wol(sock, target_ip, magic_packet):
+    """Send a magic packet to every WOL port of one address over an already-open socket."""
+    for port in _WOL_PORTS:
+        try:
+            sock.sendto(magic_packet, (target_ip, port))
+        except BlockingIOError:
+            # Send buffer momentarily full - give it a moment to drain, then retry once
+            select.select([], [sock], [], 0.1)
+            try:
+                sock.sendto(magic_packet, (target_ip, port))
+            except Exception:
+                pass
+        except Exception:
+            pass
+
 def send_magic_packet_to_ip(target_ip, magic_packet):
     """Send a magic packet to a specific IP address."""
     try:
-        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as sock:
-            sock.setsockopt(socket.SOL_SOCKET, socket.SO_BROADCAST, 1)
-            sock.settimeout(0.1)
-
-            # Send to common WOL ports
-            for port in [7, 9]:
-                try:
-                    sock.sendto(magic_packet, (target_ip, port))
-                except Exception:
-                    pass
+        _send_wol(_get_broadcast_socket(), target_ip, magic_packet)
     except Exception:
         pass
 
+# Casts send contiguous slices of this many addresses per task, across a few threads
+_CAST_CHUNK = 256
+_CAST_WORKERS = 8
+
+def _send_magic_packets(ips, magic_packet, on_progress=None, should_stop=None):
+    """
+    Send a magic packet to every address in `ips`, in contiguous slices of
+    _CAST_CHUNK addresses spread over _CAST_WORKERS threads (sendto releases the GIL).
+
+    Args:
+        ips: List of IP strings
+        magic_packet: Packet to send
+        on_progress: Called with the running count of addresses sent as each slice finishes
+        should_stop: Optional callable; once it returns True the remaining addresses are skipped
+
+    Returns:
+        int: Number of addresses sent to
+    """
+    def send_chunk(chunk):
+        # Socket fetched once per slice, not once per address
+        sock = _get_broadcast_socket()
+        sent = 0
+        for ip in chunk:
+            if should_stop is not None and should_stop():
+                break
+            _send_wol(sock, ip, magic_packet)
+            sent += 1
+        return sent
+
+    completed = 0
+    with ThreadPoolExecutor(max_workers=_CAST_WORKERS) as executor:
+        futures = [executor.submit(send_chunk, ips[i:i + _CAST_CHUNK])
+                   for i in range(0, len(ips), _CAST_CHUNK)]
+        for future in as_completed(futures):
+            completed += future.result()
+            if on_progress:
+                on_progress(completed)
+    return completed
+
 def send_magic_packet_to_device(device):
     """Send a magic packet to a specific device."""
     magic_packet = create_magic_packet(device.get('mac'))
@@ -1022,6 +1671,30 @@ def send_magic_packet_to_device(device):
     else:
         print(f"⚠️  Could not create magic packet for device {device.get('ip', 'Unknown')}")
 
+# Minimum seconds between cast progress updates posted to the Tk thread
+_CAST_PROGRESS_INTERVAL = 0.05
+
+# Treeview column -> index into a row's values for sort_treeview ('#0' sorts by the row text)
+_SORT_VALUE_INDEX = {'Status': 0, 'IP': 1, 'MAC': 2, 'Info': 3}
+
+# Device status -> (tree status symbol, colour tag); anything unrecognised shows as offline
+_STATUS_MAP = {
+    'online': ('●', 'device_online'),
+    'offline': ('○', 'device_offline'),
+    'standby': ('◐', 'device_standby'),
+}
+_STATUS_DEFAULT = ('○', 'device_offline')
+
+# How often the background writer checks for unsaved known-device/tree-state changes
+_SAVE_INTERVAL_MS = 2000
+# How often the Tk thread applies queued live scan results, and the most it takes per tick
+_LIVE_DRAIN_MS = 50
+_LIVE_DRAIN_MAX = 512
+# Debounce window for tree rebuilds triggered by scan results
+_TREE_REFRESH_MS = 150
+# Progress bar redraws are coalesced to at most one per this many ms (~30 Hz)
+_PROGRESS_FLUSH_MS = 33
+
 class WOLCasterGUI:
     def __init__(self):
         self.root = tk.Tk()
@@ -1066,12 +1739,30 @@ class WOLCasterGUI:
 
         self.network_data = {}
         self.device_data = {}
+        self._device_index = {}  # interface -> {ip: device} over device_data, for O(1) live merges
+        self._grouped_devices = {}  # interface -> {network key: {ip: device}}, classified once at ingest
         self.known_devices = {}  # Persistent device storage
         self.tree_expanded_states = {}  # Track tree expansion states
         self.debug_mode = False  # Debug mode setting
+        self._stop_event = threading.Event()  # Set while not scanning; scan waits return early on it
         self.scanning_active = False
         self.scan_thread = None
+        self.discovery_in_progress = False  # Per-device tree tracing while a discovery runs (with debug on)
+        self._first_scan_complete = False  # First cycle uses a shorter wait before the next scan
         self.broadcasting_active = False  # Track broadcast state
+        self._dirty = False  # Known devices or tree states changed since the last save
+        self._save_lock = threading.Lock()  # One writer at a time for the persistent files
+        self._live_queue = queue.Queue()  # (device, interface) results handed over by scan threads
+        self._ui_queue = queue.Queue()  # (callable, args) posted by worker threads to run on the Tk thread
+        self._pending_status = None  # Latest status text from a worker thread, applied on the next drain
+        self._tree_refresh_pending = False  # A debounced update_tree_view is already scheduled
+        self._progress_state = None  # Latest (message, current, total) waiting to be drawn
+        self._progress_flush_pending = False  # A _flush_progress is already scheduled
+        self._tree_ids = {}  # ('adapter'|'network'|'device', ...) -> tree item id
+        self._tree_keys = {}  # tree item id -> its _tree_ids key; key[1] is always the adapter name
+        self._tree_last_values = {}  # tree item id -> (text, values, tags) last written to it
+        self._tree_requests = queue.Queue()  # Debounced refreshes for the tree model worker
+        self._tree_generation = 0  # Bumped when history is cleared or imported; older tree models are dropped
 
         # Load persistent data
         self.load_persistent_data()
@@ -1082,7 +1773,26 @@ class WOLCasterGUI:
         if sys.platform == 'darwin':
             self.configure_macos_menu()
             
+        # Scan-driven refreshes build the tree model on this thread and only apply it on the Tk thread
+        threading.Thread(target=self._tree_model_worker, name="wol-tree", daemon=True).start()
+        # Persistent data is written off the Tk thread whenever something marked it dirty
+        threading.Thread(target=self._persist_worker, name="wol-save", daemon=True).start()
+
         self.start_continuous_scan()
+        self.root.after(_LIVE_DRAIN_MS, self._drain_live_queue)
+        self.root.after(_LIVE_DRAIN_MS, self._drain_ui_queue)
+
+    @property
+    def scanning_active(self):
+        """Whether continuous scrying is on (backed by _stop_event so waits can be interrupted)."""
+        return not self._stop_event.is_set()
+
+    @scanning_active.setter
+    def scanning_active(self, active):
+        if active:
+            self._stop_event.clear()
+        else:
+            self._stop_event.set()
 
     def center_window(self):
         """Center the window on screen."""
@@ -1105,20 +1815,20 @@ class WOLCasterGUI:
             # Load known devices
             devices_file = self.get_data_file_path("known_devices.json")
             if os.path.exists(devices_file):
-                with open(devices_file, 'r') as f:
-                    self.known_devices = json.load(f)
+                with open(devices_file, 'rb') as f:
+                    self.known_devices = _json_loads(f.read())
 
             # Load tree expansion states
             states_file = self.get_data_file_path("tree_states.json")
             if os.path.exists(states_file):
-                with open(states_file, 'r') as f:
-                    self.tree_expanded_states = json.load(f)
+                with open(states_file, 'rb') as f:
+                    self.tree_expanded_states = _json_loads(f.read())
 
             # Load debug mode setting
             debug_file = self.get_data_file_path("debug_settings.json")
             if os.path.exists(debug_file):
-                with open(debug_file, 'r') as f:
-                    debug_settings = json.load(f)
+                with open(debug_file, 'rb') as f:
+                    debug_settings = _json_loads(f.read())
                     self.debug_mode = debug_settings.get('debug_mode', False)
             else:
                 # Default to disabled
@@ -1129,24 +1839,44 @@ class WOLCasterGUI:
             self.tree_expanded_states = {}
             self.debug_mode = False
 
+    def _write_data_file(self, filename, data):
+        """Write compact JSON to a data file via a temp file, so a crash never leaves it half-written."""
+        path = self.get_data_file_path(filename)
+        tmp_path = path + ".tmp"
+        with open(tmp_path, 'wb') as f:
+            f.write(_json_dumps(data))
+        os.replace(tmp_path, path)
+
     def save_persistent_data(self):
-        """Save persistent device data and tree states."""
+        """Save persistent device data and tree states, if anything changed since the last save."""
         try:
-            # Save known devices
-            devices_file = self.get_data_file_path("known_devices.json")
-            with open(devices_file, 'w') as f:
-                json.dump(self.known_devices, f, indent=2)
-
-            # Save tree expansion states
-            states_file = self.get_data_file_path("tree_states.json")
-
-            with open(states_file, 'w') as f:
-                json.dump(self.tree_expanded_states, f, indent=2)
+            with self._save_lock:
+                if not self._dirty:
+                    return
+                # Clear first so changes made while writing are picked up by the next save
+                self._dirty = False
+                # Shallow snapshots so the Tk thread can keep updating while we serialize
+                known_devices = {name: list(devices) for name, devices in dict(self.known_devices).items()}
+                tree_states = dict(self.tree_expanded_states)
+
+                self._write_data_file("known_devices.json", known_devices)
+                self._write_data_file("tree_states.json", tree_states)
         except Exception as e:
+            self._dirty = True
             print(f"Error saving persistent data: {e}")
 
+    def _persist_worker(self):
+        """Background writer: saves persistent data at most once per save interval while dirty."""
+        while True:
+            time.sleep(_SAVE_INTERVAL_MS / 1000)
+            if self._dirty:
+                self.save_persistent_data()
+
     def update_known_devices(self, interface_name, devices):
         """Update known devices for an interface."""
+        # Vendors already resolved last time, keyed by MAC
+        previous_vendors = {d['mac']: d['vendor'] for d in self.known_devices.get(interface_name, [])
+                            if d.get('mac') and d.get('vendor')}
         self.known_devices[interface_name] = []
         for device in devices:
             if device['status'] != 'hidden':
@@ -1161,13 +1891,13 @@ class WOLCasterGUI:
 
                 # Add vendor information if available (preserves discovery data for offline devices)
                 if device['mac']:
-                    vendor = get_mac_vendor(device['mac'], silent=True)
+                    vendor = previous_vendors.get(device['mac']) or _cached_vendor(device['mac'])
                     if vendor and vendor != "Unknown":
                         known_device['vendor'] = vendor
                 self.known_devices[interface_name].append(known_device)
 
-        # Save to disk
-        self.save_persistent_data()
+        # Saved to disk by the background writer
+        self._dirty = True
 
     def create_widgets(self):
         # Title with wand emoji and superscript text on same line
@@ -1212,9 +1942,10 @@ class WOLCasterGUI:
         # Start button
         self.create_buttons()
 
-        # Status label
+        # Status label, driven through a StringVar so scan threads can set it without an after() hop
+        self._status_var = tk.StringVar(self.root, value="Scrying networks and devices...")
         self.status_label = tk.Label(self.root,
-                                    text="Scrying networks and devices...",
+                                    textvariable=self._status_var,
                                     font=("SF Pro Text", 10),
                                     fg="#cccccc", bg=self.dark_bg)
         self.status_label.pack(pady=(0, 10))
@@ -1309,6 +2040,8 @@ class WOLCasterGUI:
         # Hide scrollbar but keep it functional
         scrollbar.pack_forget()
 
+        self._configure_tree_tags()
+
         # Bind single-click to toggle selection and expansion
         self.tree.bind('<Button-1>', self.on_tree_click)
         self.tree.bind('<<TreeviewOpen>>', self.on_tree_expand)
@@ -1466,10 +2199,13 @@ class WOLCasterGUI:
                         # New network discovered - add it immediately
                         self.network_data[interface_name] = interface
                         self.device_data[interface_name] = []
+                        self._device_index[interface_name] = {}
+                        self._grouped_devices[interface_name] = {}
                         self.tree_expanded_states[interface_name] = True
+                        self._dirty = True
 
-                        # Update GUI immediately to show the new network
-                        self.root.after(0, self.update_tree_view)
+                        # Update GUI to show the new network
+                        self._post_ui(self._schedule_tree_refresh)
 
                 # Now scan each network with live updates
                 for interface in interfaces:
@@ -1482,178 +2218,238 @@ class WOLCasterGUI:
                     known_devices = self.known_devices.get(interface_name, [])
 
                     # Scan devices on this network with live updates
-                    devices = scan_network_for_devices_live(interface, self.live_device_callback, known_devices,
-                                                         self.update_scan_progress)
+                    devices = scan_network(interface, live_callback=self.live_device_callback,
+                                           progress_callback=self.update_scan_progress, known_devices=known_devices,
+                                           should_stop=lambda: not self.scanning_active)
+                    if not self.scanning_active:
+                        break  # Partial results from a stopped scan would mark unprobed hosts as gone
 
                     # Update data structures
                     self.network_data[interface_name] = interface
                     self.device_data[interface_name] = devices
+                    self._device_index[interface_name] = {d['ip']: d for d in devices}
+                    # Regroup off to the side and swap in whole, since the Tk thread reads it too
+                    grouped = {}
+                    for device in devices:
+                        network_key = _classify_network(device['ip'], interface['subnet'])
+                        grouped.setdefault(network_key, {})[device['ip']] = device
+                    self._grouped_devices[interface_name] = grouped
 
                     # Update known devices
                     self.update_known_devices(interface_name, devices)
 
-                # Wait before next scan (faster refresh for first scan)
-                if not hasattr(self, '_first_scan_complete'):
-                    time.sleep(5)  # Faster refresh for first scan
+                # Wait before next scan (faster refresh for first scan); stopping wakes the wait at once
+                if not self._first_scan_complete:
+                    self._stop_event.wait(5)  # Faster refresh for first scan
                     self._first_scan_complete = True
                 else:
-                    # Check for stop signal more frequently to allow immediate stopping
-                    for _ in range(30):  # Check every second instead of sleeping for 30 seconds
-                        if not self.scanning_active:
-                            break
-                        time.sleep(1)
+                    self._stop_event.wait(30)
 
                 # Show completion message if scanning is still active
                 if self.scanning_active:
-                    self.root.after(0, lambda: self.status_label.config(text="Scry cycle complete - waiting for next scan..."))
+                    self._post_status("Scry cycle complete - waiting for next scan...")
 
             except Exception as e:
                 print(f"Scan error: {e}")
-                time.sleep(10)
+                self._stop_event.wait(10)
 
         # Show completion message when scanning stops
         if not self.scanning_active:
             self.discovery_in_progress = False  # Clear flag when thread stops
             print(f"🔮 Scry thread actually stopped (scanning_active = {self.scanning_active})")
-            self.root.after(0, lambda: self.status_label.config(text="Ended Scry"))
+            self._post_status("Ended Scry")
 
     def live_device_callback(self, device, interface_name):
-        """Callback for live device updates - handles individual devices."""
+        """Callback for live device updates - queues each device for the Tk thread."""
+        # Runs on scan threads, so only hand off here; _drain_live_queue does the GUI work
+        self._live_queue.put_nowait((device, interface_name))
+
+    def _drain_live_queue(self):
+        """Apply queued live device updates on the Tk thread and redraw the tree once per batch."""
         try:
-            # Add or update device in real-time
-            if interface_name not in self.device_data:
-                self.device_data[interface_name] = []
-
-            # Check if device already exists
-            existing_device = None
-            for existing in self.device_data[interface_name]:
-                # Safety check: ensure existing is a dictionary
-                if not isinstance(existing, dict):
-                    continue
-                if existing.get('ip') == device.get('ip'):
-                    existing_device = existing
+            # Latest update per (interface, ip) wins, so bursts for one host collapse into one
+            latest = {}
+            for _ in range(_LIVE_DRAIN_MAX):
+                try:
+                    device, interface_name = self._live_queue.get_nowait()
+                except queue.Empty:
                     break
+                latest[(interface_name, device.get('ip'))] = device
 
-            if existing_device:
-                # Update existing device
-                existing_device.update(device)
-            else:
-                # Add new device
-                self.device_data[interface_name].append(device)
+            if latest:
+                for (interface_name, ip), device in latest.items():
+                    if interface_name not in self.device_data:
+                        self.device_data[interface_name] = []
+
+                    existing_device = self._device_index.setdefault(interface_name, {}).get(ip)
+                    if existing_device:
+                        # Update existing device
+                        existing_device.update(device)
+                    else:
+                        # Add new device
+                        self.device_data[interface_name].append(device)
+                        self._device_index[interface_name][ip] = device
+                        self._group_device(interface_name, device)
 
-            # Update GUI immediately with this individual device
-            self.root.after(0, self.update_tree_view)
+                self._schedule_tree_refresh()
 
         except Exception as e:
             print(f"Live device callback error: {e}")
+        finally:
+            self.root.after(_LIVE_DRAIN_MS, self._drain_live_queue)
 
-    def scan_progress_callback(self, completed, total, interface):
-        """Update scan progress."""
+    def _post_ui(self, func, *args):
+        """Run func(*args) on the Tk thread at its next drain tick; safe to call from any thread."""
+        self._ui_queue.put_nowait((func, args))
+
+    def _post_dialog(self, func, *args):
+        """Like _post_ui, but for handlers that open a modal dialog: they run once the drain has returned."""
+        self._post_ui(self.root.after_idle, func, *args)
+
+    def _post_status(self, text):
+        """Set the status line from any thread; only the latest text per drain tick is drawn."""
+        self._pending_status = text
+
+    def _drain_ui_queue(self):
+        """Run GUI work posted by worker threads, in order, on the Tk thread."""
         try:
-            self.root.after(0, lambda: self.status_label.config(
-                text=f"Scrying {interface}: {completed}/{total} devices"))
-        except Exception:
-            pass
+            status, self._pending_status = self._pending_status, None
+            if status is not None:
+                self._status_var.set(status)
+
+            for _ in range(_LIVE_DRAIN_MAX):
+                try:
+                    func, args = self._ui_queue.get_nowait()
+                except queue.Empty:
+                    break
+                try:
+                    func(*args)
+                except Exception as e:
+                    print(f"GUI update error: {e}")
+        finally:
+            self.root.after(_LIVE_DRAIN_MS, self._drain_ui_queue)
+
+    def _group_device(self, interface_name, device):
+        """File a device under its tree network group so refreshes don't re-classify every IP."""
+        interface_info = self.network_data.get(interface_name) or {}
+        network_key = _classify_network(device['ip'], interface_info.get('subnet'))
+        self._grouped_devices.setdefault(interface_name, {}).setdefault(network_key, {})[device['ip']] = device
+
+    def _schedule_tree_refresh(self):
+        """Rebuild the tree once per debounce window no matter how many updates arrive in it."""
+        if not self._tree_refresh_pending:
+            self._tree_refresh_pending = True
+            self.root.after(_TREE_REFRESH_MS, self._do_tree_refresh)
+
+    def _do_tree_refresh(self):
+        """Hand the pending debounced tree refresh to the model worker."""
+        self._tree_refresh_pending = False
+        self._tree_requests.put_nowait(True)
 
     def update_scan_progress(self, message):
-        """Update scan progress with real-time IP address information."""
-        try:
-            self.root.after(0, lambda: self.status_label.config(text=message))
-        except Exception:
-            pass
+        """Update scan progress with real-time IP address information (called from scan threads)."""
+        self._post_status(message)
+
+    def _configure_tree_tags(self):
+        """Set up the tree's colour tags once; rows only reference them by name."""
+        self.tree.tag_configure('adapter', foreground='#FFD700')  # Gold for adapters
+        self.tree.tag_configure('network', foreground='#FFFFFF')
+        self.tree.tag_configure('device_host', foreground='#FFFFFF')  # Host machine always white
+        self.tree.tag_configure('device_online', foreground='#4CAF50')
+        self.tree.tag_configure('device_offline', foreground='#F44336')
+        self.tree.tag_configure('device_standby', foreground='#FF9800')
+        self.tree.tag_configure('selected', background=self.dark_select_bg)
 
     def update_tree_view(self):
         """Update the tree view with deep hierarchy: Adapter → Network → Devices."""
         try:
-            # Save current selections and expansion states
-            selected_items = set()
-            expanded_adapters = set()
-            expanded_networks = set()
-
-            for item in self.tree.get_children():
-                item_text = self.tree.item(item, 'text')
-                if 'selected' in self.tree.item(item, 'tags'):
-                    selected_items.add(item_text)
-                if self.tree.item(item, 'open'):
-                    expanded_adapters.add(item_text.split(' (')[0])  # Adapter name
-
-                # Check children (networks) for expansion state
-                for network_item in self.tree.get_children(item):
-                    network_text = self.tree.item(network_item, 'text')
-                    if 'selected' in self.tree.item(network_item, 'tags'):
-                        selected_items.add(network_text)
-                    if self.tree.item(network_item, 'open'):
-                        expanded_networks.add(network_text.split(' (')[0])  # Network name
-
-                    # Check devices for selections
-                    for device_item in self.tree.get_children(network_item):
-                        if 'selected' in self.tree.item(device_item, 'tags'):
-                            selected_items.add(self.tree.item(device_item, 'values')[1])  # IP address
-
-            # Clear existing items
-            for item in self.tree.get_children():
-                self.tree.delete(item)
-
-            # Group devices by adapter and network
-            adapter_network_devices = {}
+            self._apply_tree_model(self._compute_tree_model())
+        except Exception as e:
+            print(f"Tree update error: {e}")
 
-            if self.debug_mode:
-                print(f"🔍 DEBUG: network_data keys: {list(self.network_data.keys())}")
-                print(f"🔍 DEBUG: device_data keys: {list(self.device_data.keys())}")
-                print(f"🔍 DEBUG: known_devices keys: {list(self.known_devices.keys())}")
-
-            # Process currently active interfaces
-            for interface_name, interface_info in self.network_data.items():
-                # Use the full interface name as the adapter identifier
-                # This ensures en0 and en1 are treated as separate adapters
-                adapter_name = interface_name
+    def _tree_model_worker(self):
+        """Build tree models off the Tk thread; refresh requests that pile up collapse into one."""
+        while True:
+            self._tree_requests.get()
+            try:
+                while True:
+                    self._tree_requests.get_nowait()
+            except queue.Empty:
+                pass
 
-                if self.debug_mode:
-                    print(f"🔍 DEBUG: Processing interface {interface_name} with subnet {interface_info['subnet']}")
+            try:
+                model = self._compute_tree_model()
+                self._post_ui(self._apply_tree_model, model)
+            except Exception as e:
+                print(f"Tree update error: {e}")
+
+    def _compute_tree_model(self):
+        """
+        Build the rows for the device tree from the current scan and persistent data.
+        Pure data work with no widget calls, so it can run on a worker thread.
+
+        Returns:
+            dict: 'adapters' as [(adapter_name, text, is_historical, networks)] where networks is
+            [(subnet, text, values, devices)] and devices is [(ip, text, values, tags)], plus 'status_text'
+            and the 'generation' it was built from
+        """
+        # Read before the snapshots so a clear or import that lands mid-build marks this model stale
+        generation = self._tree_generation
+
+        # Shallow snapshots (dict() copies are atomic) so scan threads can keep updating the originals
+        network_data = dict(self.network_data)
+        grouped_devices = dict(self._grouped_devices)
+        known_device_data = dict(self.known_devices)
+
+        # Group devices by adapter and network
+        adapter_network_devices = {}
+
+        # Per-refresh lookups hoisted out of the network/device loops below
+        discovered_subnets = {info.get('subnet') for info in network_data.values() if info.get('discovered')}
+        host_info = get_host_machine_info()
+        host_local_ips = set(host_info['local_ips'])
 
-                if adapter_name not in adapter_network_devices:
-                    adapter_network_devices[adapter_name] = {}
+        if self.debug_mode:
+            print(f"🔍 DEBUG: network_data keys: {list(network_data.keys())}")
+            print(f"🔍 DEBUG: device_data keys: {list(grouped_devices.keys())}")
+            print(f"🔍 DEBUG: known_devices keys: {list(known_device_data.keys())}")
 
-                # Get devices for this interface
-                devices = self.device_data.get(interface_name, [])
-                if self.debug_mode:
-                    print(f"🔍 DEBUG: Found {len(devices)} devices for {interface_name}")
+        # Process currently active interfaces
+        for interface_name, interface_info in network_data.items():
+            # Use the full interface name as the adapter identifier
+            # This ensures en0 and en1 are treated as separate adapters
+            adapter_name = interface_name
 
-                # Group devices by their actual network ranges, not just the interface subnet
-                # This handles cases where one interface can access multiple networks
-                network_groups = {}
+            if self.debug_mode:
+                print(f"🔍 DEBUG: Processing interface {interface_name} with subnet {interface_info['subnet']}")
 
-                # Get known devices from persistent data for smart merging
-                known_devices = self.known_devices.get(interface_name, [])
+            if adapter_name not in adapter_network_devices:
+                adapter_network_devices[adapter_name] = {}
 
-                for device in devices:
-                    # Safety check: ensure device is a dictionary
-                    if not isinstance(device, dict):
-                        continue
-                    device_ip = device.get('ip')
-                    if not device_ip:
-                        continue
-                    # Determine which network this device belongs to based on IP
-                    if device_ip.startswith('192.168.0.'):
-                        network_key = '192.168.0.0/24'
-                    elif device_ip.startswith('134.124.230.'):
-                        network_key = '134.124.230.0/24'  # Separate network
-                    elif device_ip.startswith('134.124.231.'):
-                        network_key = '134.124.231.0/24'  # Separate network
-                    else:
-                        # For any other IP ranges, use the interface subnet as fallback
-                        network_key = interface_info['subnet']
+            # Get devices for this interface, already grouped by their actual network ranges
+            device_groups = [(network_key, list(group.values()))
+                             for network_key, group in dict(grouped_devices.get(interface_name, {})).items()]
+            if self.debug_mode:
+                print(f"🔍 DEBUG: Found {sum(len(group) for _, group in device_groups)} devices for {interface_name}")
+
+            # Group devices by their actual network ranges, not just the interface subnet
+            # This handles cases where one interface can access multiple networks
+            network_groups = {}
+
+            # Get known devices from persistent data for smart merging
+            known_devices = list(known_device_data.get(interface_name, []))
+            known_by_ip = {known.get('ip'): known for known in known_devices if isinstance(known, dict)}
 
+            for network_key, devices in device_groups:
+                for device in devices:
+                    device_ip = device['ip']
+                    # Group key was chosen by _group_device (any other IP ranges use the interface subnet)
                     if network_key not in network_groups:
                         network_groups[network_key] = []
 
                     # Smart merge: combine current scan results with persistent data
                     # Find if we have stored information for this device
-                    stored_device = None
-                    for known in known_devices:
-                        if isinstance(known, dict) and known.get('ip') == device_ip:
-                            stored_device = known
-                            break
+                    stored_device = known_by_ip.get(device_ip)
 
                     # Merge current status with stored device intelligence
                     merged_device = device.copy()
@@ -1686,188 +2482,143 @@ class WOLCasterGUI:
 
                     network_groups[network_key].append(merged_device)
 
-                # Now add any offline devices from persistent data that weren't found in current scan
-                # This ensures we show offline devices with their stored intelligence
-                for known in known_devices:
-                    # Safety check: ensure known is a dictionary
-                    if not isinstance(known, dict):
-                        continue
+            # IPs already placed in each network group by the current scan
+            found_ips = {network_key: {d['ip'] for d in group} for network_key, group in network_groups.items()}
 
-                    known_ip = known.get('ip')
-                    if not known_ip:
-                        continue
+            # Now add any offline devices from persistent data that weren't found in current scan
+            # This ensures we show offline devices with their stored intelligence
+            for known in known_devices:
+                # Safety check: ensure known is a dictionary
+                if not isinstance(known, dict):
+                    continue
 
-                    # Determine network for this known device
-                    if known_ip.startswith('192.168.0.'):
-                        network_key = '192.168.0.0/24'
-                    elif known_ip.startswith('134.124.230.'):
-                        network_key = '134.124.230.0/24'  # Separate from 134.124.231.*
-                    elif known_ip.startswith('134.124.231.'):
-                        network_key = '134.124.231.0/24'  # Separate network
-                    else:
-                        network_key = interface_info['subnet']
+                known_ip = known.get('ip')
+                if not known_ip:
+                    continue
 
-                    # Check if this device is already in the current scan results
-                    already_found = any(d['ip'] == known_ip for d in network_groups.get(network_key, []))
+                # Determine network for this known device
+                network_key = _classify_network(known_ip, interface_info['subnet'])
 
-                    if not already_found:
-                        # This device is offline - add it with stored intelligence
-                        offline_device = known.copy()
-                        offline_device['status'] = 'offline'  # Mark as offline
-                        offline_device['current_scan'] = False  # Flag that this wasn't found in current scan
+                # Check if this device is already in the current scan results
+                already_found = known_ip in found_ips.get(network_key, ())
 
-                        if network_key not in network_groups:
-                            network_groups[network_key] = []
-                        network_groups[network_key].append(offline_device)
+                if not already_found:
+                    # This device is offline - add it with stored intelligence
+                    offline_device = known.copy()
+                    offline_device['status'] = 'offline'  # Mark as offline
+                    offline_device['current_scan'] = False  # Flag that this wasn't found in current scan
 
-                # Now add each network group to the adapter
-                for network_key, network_devices in network_groups.items():
-                    if network_key not in adapter_network_devices[adapter_name]:
-                        adapter_network_devices[adapter_name][network_key] = []
-                    adapter_network_devices[adapter_name][network_key].extend(network_devices)
+                    if network_key not in network_groups:
+                        network_groups[network_key] = []
+                    network_groups[network_key].append(offline_device)
+                    found_ips.setdefault(network_key, set()).add(known_ip)
 
-            # Process historical interfaces from persistent data that aren't currently active
-            for interface_name, known_devices in self.known_devices.items():
-                if interface_name not in self.network_data:
-                    # This is a historical interface not currently active
-                    adapter_name = interface_name
+            # Now add each network group to the adapter
+            for network_key, network_devices in network_groups.items():
+                if network_key not in adapter_network_devices[adapter_name]:
+                    adapter_network_devices[adapter_name][network_key] = []
+                adapter_network_devices[adapter_name][network_key].extend(network_devices)
+
+        # Process historical interfaces from persistent data that aren't currently active
+        for interface_name, known_devices in known_device_data.items():
+            if interface_name not in network_data:
+                # This is a historical interface not currently active
+                adapter_name = interface_name
 
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Processing historical interface {interface_name} with {len(known_devices)} known devices")
+                if self.debug_mode:
+                    print(f"🔍 DEBUG: Processing historical interface {interface_name} with {len(known_devices)} known devices")
 
-                    if adapter_name not in adapter_network_devices:
-                        adapter_network_devices[adapter_name] = {}
+                if adapter_name not in adapter_network_devices:
+                    adapter_network_devices[adapter_name] = {}
 
-                    # Group historical devices by network
-                    for device in known_devices:
-                        if not isinstance(device, dict):
-                            continue
+                # Group historical devices by network
+                for device in known_devices:
+                    if not isinstance(device, dict):
+                        continue
 
-                        device_ip = device.get('ip')
-                        if not device_ip:
-                            continue
+                    device_ip = device.get('ip')
+                    if not device_ip:
+                        continue
 
-                        # Determine network for this historical device
-                        if device_ip.startswith('192.168.0.'):
-                            network_key = '192.168.0.0/24'
-                        elif device_ip.startswith('134.124.230.'):
-                            network_key = '134.124.230.0/24'
-                        elif device_ip.startswith('134.124.231.'):
-                            network_key = '134.124.231.0/24'
+                    # Determine network for this historical device
+                    network_key = _classify_network(device_ip, None)
+                    if network_key is None:
+                        # Use a generic network key for unknown ranges
+                        network_parts = device_ip.split('.')
+                        if len(network_parts) >= 3:
+                            network_key = f"{'.'.join(network_parts[:3])}.0/24"
                         else:
-                            # Use a generic network key for unknown ranges
-                            network_parts = device_ip.split('.')
-                            if len(network_parts) >= 3:
-                                network_key = f"{'.'.join(network_parts[:3])}.0/24"
-                            else:
-                                continue
+                            continue
 
-                        if network_key not in adapter_network_devices[adapter_name]:
-                            adapter_network_devices[adapter_name][network_key] = []
+                    if network_key not in adapter_network_devices[adapter_name]:
+                        adapter_network_devices[adapter_name][network_key] = []
 
-                        # Mark as offline and historical
-                        historical_device = device.copy()
-                        historical_device['status'] = 'offline'
-                        historical_device['current_scan'] = False
-                        historical_device['historical'] = True
+                    # Mark as offline and historical
+                    historical_device = device.copy()
+                    historical_device['status'] = 'offline'
+                    historical_device['current_scan'] = False
+                    historical_device['historical'] = True
 
-                        adapter_network_devices[adapter_name][network_key].append(historical_device)
+                    adapter_network_devices[adapter_name][network_key].append(historical_device)
 
+        if self.debug_mode:
+            print(f"🔍 DEBUG: Final adapter_network_devices structure: {adapter_network_devices}")
+
+        # Per-device tracing, decided once so the f-strings below aren't built when it's off
+        trace_devices = self.debug_mode and self.discovery_in_progress
+
+        # Turn the groups into display rows, counting devices in the same pass
+        adapters = []
+        total_devices = 0
+        total_online = 0
+        total_offline = 0
+        total_with_intelligence = 0
+        for adapter_name, networks in adapter_network_devices.items():
+            # Get interface type (WiFi vs Ethernet)
+            interface_type = self.get_interface_type(adapter_name)
             if self.debug_mode:
-                print(f"🔍 DEBUG: Final adapter_network_devices structure: {adapter_network_devices}")
-
-            # Build the deep tree structure
-            for adapter_name, networks in adapter_network_devices.items():
-                # Get interface type (WiFi vs Ethernet)
-                interface_type = self.get_interface_type(adapter_name)
-                if self.debug_mode:
-                    print(f"🔍 DEBUG: Interface {adapter_name} detected as {interface_type}")
-
-                # Check if this is a historical interface and add appropriate label
-                is_historical = adapter_name not in self.network_data
-                if is_historical:
-                    adapter_text = f"{adapter_name} ({interface_type} - Historical)"
-                else:
-                    adapter_text = f"{adapter_name} ({interface_type})"
-                adapter_tags = ['adapter']
-                if adapter_text in selected_items:
-                    adapter_tags.append('selected')
-
-                adapter_item = self.tree.insert('', 'end', text=adapter_text,
-                                              values=('', '', '', ''),
-                                              tags=adapter_tags)
-
-                # Add networks as children of adapter
-                for network_subnet, devices in networks.items():
-                    # Format network display with asterisk notation
-                    try:
-                        network_obj = ipaddress.IPv4Network(network_subnet, strict=False)
-                        # Use standard network notation (.0 for network address)
-                        if network_subnet == '192.168.0.0/24':
-                            range_display = "192.168.0.0"
-                        elif network_subnet == '134.124.230.0/24':
-                            range_display = "134.124.230.0"
-                        else:
-                            # Fallback to original format for other networks
-                            range_display = f"{network_obj.network_address} - {network_obj.broadcast_address}"
-                    except Exception:
-                        range_display = network_subnet
+                print(f"🔍 DEBUG: Interface {adapter_name} detected as {interface_type}")
 
-                device_count = len(devices)
-                online_count = sum(1 for d in devices if d['status'] == 'online')
+            # Check if this is a historical interface and add appropriate label
+            is_historical = adapter_name not in network_data
+            if is_historical:
+                adapter_text = f"{adapter_name} ({interface_type} - Historical)"
+            else:
+                adapter_text = f"{adapter_name} ({interface_type})"
 
-                # Determine network status color
-                if online_count > 0:
-                    network_color = '#4CAF50'  # Green if any devices online
-                elif device_count > 0:
-                    network_color = '#F44336'  # Red if devices but all offline
-                else:
-                    network_color = '#FFFFFF'  # White if no devices
+            network_rows = []
+            for network_subnet, devices in networks.items():
+                # Format network display
+                range_display = _network_range_display(network_subnet)
 
                 # Check if this is a discovered network (not primary interface network)
-                is_discovered = False
-                for interface_info in self.network_data.values():
-                    if interface_info.get('subnet') == network_subnet and interface_info.get('discovered'):
-                        is_discovered = True
-                        break
+                is_discovered = network_subnet in discovered_subnets
 
                 network_text = f"Network: {range_display}"
                 if is_discovered:
                     network_text += " (Discovered)"
 
-                network_tags = ['network']
-                if network_text in selected_items:
-                    network_tags.append('selected')
-
-                network_item = self.tree.insert(adapter_item, 'end', text=network_text,
-                                          values=('', '', '', f"{online_count}/{device_count} devices"),
-                                          tags=network_tags)
-
-                # Sort devices by IP address (alphanumeric)
-                sorted_devices = sorted(devices, key=lambda x: [int(part) for part in x['ip'].split('.')])
+                # Sort devices by IP address (numeric)
+                sorted_devices = sorted(devices, key=_ip_sort_key)
 
-                # Add devices as children of network
+                device_rows = []
+                device_count = 0
+                online_count = 0
                 for device in sorted_devices:
-                    # Determine status symbol and color
+                    device_count += 1
                     if device['status'] == 'online':
-                        status_symbol = "●"
-                        status_color = '#4CAF50'  # Green
+                        online_count += 1
                     elif device['status'] == 'offline':
-                        status_symbol = "○"
-                        status_color = '#F44336'  # Red
-                    elif device['status'] == 'standby':
-                        status_symbol = "◐"
-                        status_color = '#FF9800'  # Orange
-                    else:
-                        status_symbol = "○"
-                        status_color = '#F44336'  # Red
+                        total_offline += 1
+                    if device.get('vendor') or device.get('hostname'):
+                        total_with_intelligence += 1
+
+                    # Determine status symbol and colour tag
+                    status_symbol, status_tag = _STATUS_MAP.get(device['status'], _STATUS_DEFAULT)
 
                     # Check if this is the host machine
-                    host_info = get_host_machine_info()
-                    if device['ip'] in host_info['local_ips']:
+                    if device['ip'] in host_local_ips:
                         device_text = f"🖥️  {host_info['hostname']}.local"
-                        # Host machine gets special white color and no status-based coloring
-                        device_tags = ['device_host']
                     else:
                         # Smart display: show stored hostname if available, otherwise fallback
                         if device.get('hostname') and device['hostname'] not in ['.1', '.24', '.69', '.12', '.113', '.220', '.243']:
@@ -1878,10 +2629,7 @@ class WOLCasterGUI:
                             device_text = f"Device-{device['ip'].split('.')[-1]}"
 
                     # No status text in device name - keep it clean
-                    device_tags = [f"device_{device['status']}"]
-
-                    if device['ip'] in selected_items:
-                        device_tags.append('selected')
+                    device_tags = [status_tag]
 
                     mac_display = device['mac'] or 'Unknown'
 
@@ -1892,7 +2640,7 @@ class WOLCasterGUI:
                         # For offline devices, use stored vendor info if available
                         if device['status'] in ['online', 'standby']:
                             # Fresh lookup for active devices
-                            vendor = get_mac_vendor(device['mac'], silent=True)
+                            vendor = _cached_vendor(device['mac'])
                             if vendor and vendor != "Unknown":
                                 vendor_info = vendor
                             else:
@@ -1904,224 +2652,163 @@ class WOLCasterGUI:
                             else:
                                 vendor_info = device['status'].title()
                         # Only show debug during actual discovery, not tree refreshes
-                        if hasattr(self, 'discovery_in_progress') and self.discovery_in_progress:
+                        if trace_devices:
                             print(f"🔍 Device {device['ip']}: MAC={device['mac']}, Vendor={vendor_info}")
                     else:
                         # No MAC address - fallback to status
                         vendor_info = device['status'].title()
-                        if hasattr(self, 'discovery_in_progress') and self.discovery_in_progress:
+                        if trace_devices:
                             print(f"🔍 Device {device['ip']}: No MAC address found, using status: {vendor_info}")
 
                     # Only show debug during actual discovery, not tree refreshes
-                    if hasattr(self, 'discovery_in_progress') and self.discovery_in_progress:
+                    if trace_devices:
                         print(f"🌳 Inserting device {device['ip']} with vendor_info: '{vendor_info}'")
 
-                    device_item = self.tree.insert(network_item, 'end', text=device_text,
-                                                 values=(status_symbol, device['ip'], mac_display, vendor_info),
-                                                 tags=device_tags)
+                    device_rows.append((device['ip'], device_text,
+                                        (status_symbol, device['ip'], mac_display, vendor_info), device_tags))
+
+                network_rows.append((network_subnet, network_text,
+                                     ('', '', '', f"{online_count}/{device_count} devices"), device_rows))
+                total_devices += device_count
+                total_online += online_count
+            adapters.append((adapter_name, adapter_text, is_historical, network_rows))
+
+        # Update status with smart merging info
+        total_adapters = len(adapter_network_devices)
+        total_networks = sum(len(networks) for networks in adapter_network_devices.values())
+
+        status_text = f"Found {total_adapters} adapters, {total_networks} networks, {total_online}/{total_devices} devices online"
+        if total_offline > 0:
+            status_text += f" ({total_offline} offline with stored intelligence)"
+        if total_with_intelligence > 0:
+            status_text += f" - {total_with_intelligence} devices with enhanced info"
+        if total_devices > 10:  # Only show scroll hint if there are many items
+            status_text += " (Use mouse wheel or arrow keys to scroll)"
+
+        return {'adapters': adapters, 'status_text': status_text, 'generation': generation}
+
+    def _apply_tree_model(self, model):
+        """
+        Write a _compute_tree_model() result into the tree (Tk thread only): update rows that
+        changed, insert new ones and delete the rest. Rows that stay keep their selection and expansion.
+        Models built before the last history clear or import are dropped.
+        """
+        if model.get('generation') != self._tree_generation:
+            return
 
-                # Restore expansion state for networks (default to expanded)
-                if network_text in expanded_networks or self.tree_expanded_states.get(network_text, True):
-                    self.tree.item(network_item, open=True)
-                    self.tree_expanded_states[network_text] = True
-                else:
-                    self.tree.item(network_item, open=False)
-                    self.tree_expanded_states[network_text] = False
-
-            # Restore expansion state for adapters (default to expanded for active, collapsed for historical)
-            for adapter_name in adapter_network_devices.keys():
-                # Check if this is a historical (inactive) adapter
-                is_historical = adapter_name not in self.network_data
-                default_expanded = not is_historical  # Active adapters default to expanded, historical to collapsed
-
-                if adapter_name in expanded_adapters or self.tree_expanded_states.get(adapter_name, default_expanded):
-                    # Find the adapter item and expand it
-                    for item in self.tree.get_children():
-                        if adapter_name in self.tree.item(item, 'text'):
-                            self.tree.item(item, open=True)
-                            self.tree_expanded_states[adapter_name] = True
-                            break
-                else:
-                    self.tree_expanded_states[adapter_name] = False
-
-            # Configure tags for colors
-            self.tree.tag_configure('adapter', foreground='#FFD700')  # Gold for adapters
-            self.tree.tag_configure('network', foreground='#FFFFFF')
-            self.tree.tag_configure('device_host', foreground='#FFFFFF')  # Host machine always white
-            self.tree.tag_configure('device_online', foreground='#4CAF50')
-            self.tree.tag_configure('device_offline', foreground='#F44336')
-            self.tree.tag_configure('device_standby', foreground='#FF9800')
-            self.tree.tag_configure('selected', background=self.dark_select_bg)
-
-            # Save tree states
-            self.save_persistent_data()
+        try:
+            seen_keys = set()
+            child_orders = []
+            adapter_order = []
+            for adapter_name, adapter_text, is_historical, network_rows in model['adapters']:
+                adapter_key = ('adapter', adapter_name)
+                seen_keys.add(adapter_key)
+                adapter_item, is_new = self._upsert_tree_row(adapter_key, '', adapter_text,
+                                                             ('', '', '', ''), ['adapter'])
+                adapter_order.append(adapter_item)
+                if is_new:
+                    # Active adapters default to expanded, historical to collapsed
+                    expanded = self.tree_expanded_states.get(adapter_name, not is_historical)
+                    self.tree.item(adapter_item, open=expanded)
+                    self.tree_expanded_states[adapter_name] = expanded
+                    self._dirty = True
+
+                # Add networks as children of adapter
+                network_order = []
+                for network_subnet, network_text, network_values, device_rows in network_rows:
+                    network_key = ('network', adapter_name, network_subnet)
+                    seen_keys.add(network_key)
+                    network_item, is_new = self._upsert_tree_row(network_key, adapter_item, network_text,
+                                                                 network_values, ['network'])
+                    network_order.append(network_item)
+                    if is_new:
+                        # Networks default to expanded
+                        expanded = self.tree_expanded_states.get(network_text, True)
+                        self.tree.item(network_item, open=expanded)
+                        self.tree_expanded_states[network_text] = expanded
+                        self._dirty = True
+
+                    # Add devices as children of network
+                    device_order = []
+                    for ip, device_text, device_values, device_tags in device_rows:
+                        device_key = ('device', adapter_name, network_subnet, ip)
+                        seen_keys.add(device_key)
+                        device_item, _ = self._upsert_tree_row(device_key, network_item, device_text,
+                                                               device_values, device_tags)
+                        device_order.append(device_item)
+                    child_orders.append((network_item, device_order))
+                child_orders.append((adapter_item, network_order))
+            child_orders.append(('', adapter_order))
+
+            # Drop rows for adapters, networks and devices that are no longer in the model, in one
+            # Tk call. Rows under a parent that is itself going away are removed along with it.
+            stale_keys = {key for key in self._tree_ids if key not in seen_keys}
+            stale_items = []
+            for key in stale_keys:
+                item = self._tree_ids.pop(key)
+                self._tree_keys.pop(item, None)
+                self._tree_last_values.pop(item, None)
+                if key[0] == 'device' and ('network',) + key[1:3] in stale_keys:
+                    continue
+                if key[0] == 'network' and ('adapter', key[1]) in stale_keys:
+                    continue
+                stale_items.append(item)
+            if stale_items:
+                self.tree.delete(*stale_items)
+
+            # Put rows back in model order only where it differs (new rows land at the end),
+            # resetting each parent's children in one call rather than moving rows one by one
+            for parent, order in child_orders:
+                if self.tree.get_children(parent) != tuple(order):
+                    self.tree.set_children(parent, *order)
 
-            # Update status with smart merging info
-            total_adapters = len(adapter_network_devices)
-            total_networks = sum(len(networks) for networks in adapter_network_devices.values())
-
-            # Count devices from the merged network groups (with safety checks)
-            total_devices = 0
-            total_online = 0
-            total_offline = 0
-            total_with_intelligence = 0
-
-            for devices in adapter_network_devices.values():
-                if isinstance(devices, dict):
-                    for device_list in devices.values():
-                        if isinstance(device_list, list):
-                            total_devices += len(device_list)
-                            for d in device_list:
-                                if isinstance(d, dict):
-                                    if d.get('status') == 'online':
-                                        total_online += 1
-                                    elif d.get('status') == 'offline':
-                                        total_offline += 1
-                                    if d.get('vendor') or d.get('hostname'):
-                                        total_with_intelligence += 1
-
-            status_text = f"Found {total_adapters} adapters, {total_networks} networks, {total_online}/{total_devices} devices online"
-            if total_offline > 0:
-                status_text += f" ({total_offline} offline with stored intelligence)"
-            if total_with_intelligence > 0:
-                status_text += f" - {total_with_intelligence} devices with enhanced info"
-            if total_devices > 10:  # Only show scroll hint if there are many items
-                status_text += " (Use mouse wheel or arrow keys to scroll)"
-
-            self.status_label.config(text=status_text)
+            self._status_var.set(model['status_text'])
         except Exception as e:
             print(f"Tree update error: {e}")
 
+    def _upsert_tree_row(self, key, parent, text, values, tags):
+        """
+        Insert the tree row for `key`, or update it in place if its contents changed.
+
+        Returns:
+            tuple: (item id, whether the row was newly inserted)
+        """
+        row = (text, tuple(values), tuple(tags))
+        item = self._tree_ids.get(key)
+        if item is None:
+            item = self.tree.insert(parent, 'end', text=text, values=values, tags=tags)
+            self._tree_ids[key] = item
+            self._tree_keys[item] = key
+            self._tree_last_values[item] = row
+            return item, True
+
+        if self._tree_last_values.get(item) != row:
+            # Selection lives in the row's tags, so carry it over
+            if 'selected' in self.tree.item(item, 'tags'):
+                tags = list(tags) + ['selected']
+            self.tree.item(item, text=text, values=values, tags=tags)
+            self._tree_last_values[item] = row
+        return item, False
+
     def get_interface_type(self, interface_name):
         """Determine if an interface is WiFi or Ethernet by querying the system."""
         try:
-            if platform.system() == 'Darwin':  # macOS
-                # Use system_profiler to get actual interface type
-                try:
+            if _SYSTEM == 'Darwin':  # macOS
+                # One cached system_profiler parse answers every interface
+                interface_type = _macos_interface_types().get(interface_name)
+                if interface_type:
                     if self.debug_mode:
-                        print(f"🔍 DEBUG: Running system_profiler for interface {interface_name}")
-                    result = subprocess.run(['system_profiler', 'SPNetworkDataType'],
-                                          capture_output=True, text=True, timeout=10)
-
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: system_profiler return code: {result.returncode}")
-                    if result.returncode == 0:
-                        output = result.stdout
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: system_profiler output length: {len(output)} characters")
-
-                        # Look for the specific interface in the output
-                        interface_section = None
-                        lines = output.split('\n')
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: Looking for interface {interface_name} in {len(lines)} lines")
-
-                        for i, line in enumerate(lines):
-                            if interface_name in line:
-                                if self.debug_mode:
-                                    print(f"🔍 DEBUG: Found {interface_name} at line {i}: '{line.strip()}'")
-                                # Found the interface, look for type info in nearby lines
-                                for j in range(max(0, i-10), min(len(lines), i+10)):
-                                    if 'Type:' in lines[j]:
-                                        type_line = lines[j].strip()
-                                        if self.debug_mode:
-                                            print(f"🔍 DEBUG: Found Type line at {j}: '{type_line}'")
-                                        if 'Wi-Fi' in type_line or 'WiFi' in type_line or 'AirPort' in type_line:
-                                            if self.debug_mode:
-                                                print(f"🔍 DEBUG: Detected WiFi for {interface_name}")
-                                            return "WiFi"
-                                        elif 'Ethernet' in type_line:
-                                            if self.debug_mode:
-                                                print(f"🔍 DEBUG: Detected Ethernet for {interface_name}")
-                                            return "Ethernet"
-                                        elif 'Thunderbolt' in type_line:
-                                            if self.debug_mode:
-                                                print(f"🔍 DEBUG: Detected Thunderbolt for {interface_name}")
-                                            return "Thunderbolt"
-                                        break
-                                break
-
-                        # Fallback: check if interface name appears in WiFi or Ethernet sections
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: Trying fallback section detection for {interface_name}")
-
-                        if ('Wi-Fi' in output or 'AirPort' in output) and interface_name in output:
-                            # Simple heuristic: if it's in a WiFi section, it's WiFi
-                            wifi_start = output.find('Wi-Fi') if 'Wi-Fi' in output else output.find('AirPort')
-                            wifi_end = output.find('\n\n', wifi_start)
-                            if wifi_end == -1:
-                                wifi_end = len(output)
-                            wifi_section = output[wifi_start:wifi_end]
-                            if self.debug_mode:
-                                print(f"🔍 DEBUG: WiFi section contains {interface_name}: {interface_name in wifi_section}")
-                            if interface_name in wifi_section:
-                                if self.debug_mode:
-                                    print(f"🔍 DEBUG: Fallback detected WiFi for {interface_name}")
-                                return "WiFi"
-
-                        if 'Ethernet' in output and interface_name in output:
-                            ethernet_start = output.find('Ethernet')
-                            ethernet_end = output.find('\n\n', ethernet_start)
-                            if ethernet_end == -1:
-                                ethernet_end = len(output)
-                            ethernet_section = output[ethernet_start:ethernet_end]
-                            if self.debug_mode:
-                                print(f"🔍 DEBUG: Ethernet section contains {interface_name}: {interface_name in ethernet_section}")
-                            if interface_name in ethernet_section:  # Fixed the bug here
-                                if self.debug_mode:
-                                    print(f"🔍 DEBUG: Fallback detected Ethernet for {interface_name}")
-                                return "Ethernet"
-
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: No type found in system_profiler output for {interface_name}")
-
-                    else:
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: system_profiler failed with return code {result.returncode}")
-                            if result.stderr:
-                                print(f"🔍 DEBUG: system_profiler stderr: {result.stderr}")
-
-                except Exception as e:
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: system_profiler failed with exception: {e}")
+                        print(f"🔍 DEBUG: system_profiler lists {interface_name} as {interface_type}")
+                    return interface_type
 
                 # Fallback to naming conventions (less reliable)
+                interface_type = _interface_type_from_name(interface_name, _IFACE_PREFIX_TYPES_MACOS)
                 if self.debug_mode:
-                    print(f"🔍 DEBUG: Using naming convention fallback for {interface_name}")
-                if interface_name.startswith('en0'):
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Naming convention: en0 → WiFi")
-                    return "WiFi"  # en0 is typically WiFi on macOS
-                elif interface_name.startswith('en1'):
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Naming convention: en1 → Ethernet")
-                    return "Ethernet"  # en1 is typically Ethernet on macOS
-                elif interface_name.startswith('wlan'):
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Naming convention: wlan → WiFi")
-                    return "WiFi"
-                elif interface_name.startswith('eth'):
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Naming convention: eth → Ethernet")
-                    return "Ethernet"
-                elif interface_name.startswith('lo'):
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Naming convention: lo → Loopback")
-                    return "Loopback"
-                else:
-                    if self.debug_mode:
-                        print(f"🔍 DEBUG: Naming convention: {interface_name} → Network")
-                    return "Network"
+                    print(f"🔍 DEBUG: Naming convention: {interface_name} → {interface_type}")
+                return interface_type
             else:
                 # Non-macOS systems
-                if interface_name.startswith('wlan'):
-                    return "WiFi"
-                elif interface_name.startswith('eth'):
-                    return "Ethernet"
-                elif interface_name.startswith('lo'):
-                    return "Loopback"
-                else:
-                    return "Network"
+                return _interface_type_from_name(interface_name)
         except Exception as e:
             print(f"🔍 DEBUG: Interface type detection failed: {e}")
             return "Network"
@@ -2140,47 +2827,39 @@ class WOLCasterGUI:
         self.sort_treeview(column, self.sort_reverse)
 
     def sort_treeview(self, column, reverse):
-        """Sort treeview by column."""
+        """Sort treeview by column, reordering rows within each adapter/network."""
         try:
-            # Get all items and their data
-            items = []
-            for item in self.tree.get_children():
-                item_data = self.tree.item(item)
-                items.append((item, item_data))
-
-                # Get children
-                for child in self.tree.get_children(item):
-                    child_data = self.tree.item(child)
-                    items.append((child, child_data))
-
-            # Sort items
-            if column == '#0':
-                # Sort by name
-                items.sort(key=lambda x: x[1]['text'], reverse=reverse)
-            elif column == 'Status':
-                # Sort by status
-                items.sort(key=lambda x: x[1]['values'][0] if x[1]['values'] else '', reverse=reverse)
-            elif column == 'IP':
-                # Sort by IP address (numeric)
-                def ip_key(x):
-                    if x[1]['values'] and len(x[1]['values']) > 1:
-                        ip = x[1]['values'][1]
-                        try:
-                            return [int(part) for part in ip.split('.')]
-                        except Exception:
-                            return [0, 0, 0, 0]
-                    return [0, 0, 0, 0]
-                items.sort(key=ip_key, reverse=reverse)
-            elif column == 'MAC':
-                # Sort by MAC address
-                items.sort(key=lambda x: x[1]['values'][2] if x[1]['values'] and len(x[1]['values']) > 2 else '', reverse=reverse)
-            elif column == 'Info':
-                # Sort by additional info (vendor information)
-                items.sort(key=lambda x: x[1]['values'][4] if x[1]['values'] and len(x[1]['values']) > 4 else '', reverse=reverse)
-
-            # Reorder items in treeview
-            for item, item_data in items:
-                self.tree.move(item, '', 'end')
+            value_index = _SORT_VALUE_INDEX.get(column)
+            parents = ['']
+            while parents:
+                parent = parents.pop()
+                # Read every row once, keeping ids and sort keys in parallel lists
+                ids = list(self.tree.get_children(parent))
+                keys = []
+                for item in ids:
+                    item_data = self.tree.item(item)
+                    if value_index is None:
+                        # Sort by name
+                        keys.append(item_data['text'])
+                    else:
+                        values = item_data['values']
+                        value = str(values[value_index]) if len(values) > value_index else ''
+                        if column == 'IP':
+                            # Sort by IP address (numeric); adapter/network rows have none
+                            try:
+                                keys.append(int.from_bytes(socket.inet_aton(value), 'big'))
+                            except OSError:
+                                keys.append(-1)
+                        else:
+                            keys.append(value)
+                    # Only adapters and networks have rows beneath them
+                    if not any(tag.startswith('device_') for tag in item_data['tags']):
+                        parents.append(item)
+
+                order = sorted(range(len(ids)), key=keys.__getitem__, reverse=reverse)
+
+                # Reorder items in treeview with one call per parent rather than one move per row
+                self.tree.set_children(parent, *[ids[i] for i in order])
 
         except Exception as e:
             print(f"Sort error: {e}")
@@ -2201,23 +2880,25 @@ class WOLCasterGUI:
 
                 self.tree.item(item, tags=current_tags)
 
-                # Configure selected appearance
-                self.tree.tag_configure('selected', background=self.dark_select_bg)
-
                 # Force tree update to reflect changes immediately
                 self.root.after(10, self.update_tree_view)
         except Exception as e:
             print(f"Click handler error: {e}")
 
+    def _tree_state_name(self, item):
+        """Name a row's expanded state is saved under: the adapter name for adapters, else the row text."""
+        key = self._tree_keys.get(item)
+        if key is not None and key[0] == 'adapter':
+            return key[1]
+        return self.tree.item(item, 'text')
+
     def on_tree_expand(self, event):
         """Handle tree expansion events."""
         try:
             item = self.tree.focus()
             if item:
-                item_text = self.tree.item(item, 'text')
-                interface_name = item_text.split(' (')[0]
-                self.tree_expanded_states[interface_name] = True
-                self.save_persistent_data()
+                self.tree_expanded_states[self._tree_state_name(item)] = True
+                self._dirty = True
         except Exception as e:
             print(f"Tree expand error: {e}")
 
@@ -2226,10 +2907,8 @@ class WOLCasterGUI:
         try:
             item = self.tree.focus()
             if item:
-                item_text = self.tree.item(item, 'text')
-                interface_name = item_text.split(' (')[0]
-                self.tree_expanded_states[interface_name] = False
-                self.save_persistent_data()
+                self.tree_expanded_states[self._tree_state_name(item)] = False
+                self._dirty = True
         except Exception as e:
             print(f"Tree collapse error: {e}")
 
@@ -2289,24 +2968,28 @@ class WOLCasterGUI:
             self.clear_item_and_children(item)
 
     def select_item_and_children(self, item):
-        """Recursively select an item and its children."""
-        current_tags = list(self.tree.item(item, 'tags'))
-        if 'selected' not in current_tags:
-            current_tags.append('selected')
-            self.tree.item(item, tags=current_tags)
+        """Select an item and everything beneath it."""
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            current_tags = list(self.tree.item(item, 'tags'))
+            if 'selected' not in current_tags:
+                current_tags.append('selected')
+                self.tree.item(item, tags=current_tags)
 
-        # Select children
-        for child in self.tree.get_children(item):
-            self.select_item_and_children(child)
+            # Select children
+            stack.extend(self.tree.get_children(item))
 
     def clear_item_and_children(self, item):
-        """Recursively clear selection from an item and its children."""
-        current_tags = [tag for tag in self.tree.item(item, 'tags') if tag != 'selected']
-        self.tree.item(item, tags=current_tags)
+        """Clear selection from an item and everything beneath it."""
+        stack = [item]
+        while stack:
+            item = stack.pop()
+            current_tags = [tag for tag in self.tree.item(item, 'tags') if tag != 'selected']
+            self.tree.item(item, tags=current_tags)
 
-        # Clear children
-        for child in self.tree.get_children(item):
-            self.clear_item_and_children(child)
+            # Clear children
+            stack.extend(self.tree.get_children(item))
 
     def clear_persistent_data(self):
         """Clear all persistent device data and tree states."""
@@ -2321,13 +3004,18 @@ class WOLCasterGUI:
                 # Clear in-memory data structures that populate the tree
                 self.network_data = {}
                 self.device_data = {}
+                self._device_index = {}
+                self._grouped_devices = {}
+                self._tree_generation += 1
 
                 # Clear the tree view immediately
-                for item in self.tree.get_children():
-                    self.tree.delete(item)
+                self.tree.delete(*self.tree.get_children())
+                self._tree_ids = {}
+                self._tree_keys = {}
+                self._tree_last_values = {}
 
                 # Update status to reflect empty state
-                self.status_label.config(text="History cleared. Click 'Start Scry' to begin discovery...")
+                self._status_var.set("History cleared. Click 'Start Scry' to begin discovery...")
 
                 # Stop scanning and update button state
                 self.scanning_active = False
@@ -2350,8 +3038,7 @@ class WOLCasterGUI:
 
                 # Force a fresh scan by clearing any cached data
                 # This ensures no old offline devices appear temporarily
-                if hasattr(self, '_first_scan_complete'):
-                    delattr(self, '_first_scan_complete')
+                self._first_scan_complete = False
 
                 # The scanning thread will repopulate the data structures and tree
                 messagebox.showinfo("History Cleared",
@@ -2381,10 +3068,10 @@ class WOLCasterGUI:
             }
 
             # Format JSON for display
-            json_output = json.dumps(export_data, indent=2, default=str)
+            json_output = _json_dumps_pretty(export_data)
 
             # Create the terminal command with proper sizing
-            if platform.system() == 'Darwin':  # macOS
+            if _SYSTEM == 'Darwin':  # macOS
                 # Use Terminal.app with proper sizing (CLI standard: 100x50)
                 # Write JSON to temporary file to avoid escaping issues
                 import tempfile
@@ -2453,81 +3140,73 @@ rm '{temp_file_path}'
         """Get all selected items from the tree."""
         selected_networks = []
         selected_devices = []
+        # Read once for the whole walk; the tree can hold hundreds of rows
+        debug = self.debug_mode
 
         def check_item(item):
-            tags = self.tree.item(item, 'tags')
-            item_text = self.tree.item(item, 'text')
-            if self.debug_mode:
+            # One Tk round trip for the row's tags, text and values
+            item_data = self.tree.item(item)
+            tags = item_data['tags']
+            item_text = item_data['text']
+            if debug:
                 print(f"🔍 DEBUG: Checking item '{item_text}' with tags: {tags}")
 
             if 'selected' in tags:
-                if self.debug_mode:
+                if debug:
                     print(f"🔍 DEBUG: Item '{item_text}' is selected")
-                if 'adapter' in tags:
+                # Every row's key carries its adapter's interface name, e.g. ('network', 'en1', subnet)
+                key = self._tree_keys.get(item)
+                if key is None:
+                    if debug:
+                        print(f"🔍 DEBUG: Item '{item_text}' is not a known tree row")
+                elif 'adapter' in tags:
                     # Adapter selected - add all networks under this adapter
-                    adapter_name = item_text.split(' (')[0]  # Extract en1 from "en1 (WiFi)"
-                    if self.debug_mode:
+                    adapter_name = key[1]
+                    if debug:
                         print(f"🔍 DEBUG: Adapter '{item_text}' selected, adding all networks under '{adapter_name}'")
                     if adapter_name in self.network_data:
                         selected_networks.append(adapter_name)
-                        if self.debug_mode:
+                        if debug:
                             print(f"🔍 DEBUG: Added adapter '{adapter_name}' to selected_networks")
                     else:
-                        if self.debug_mode:
+                        if debug:
                             print(f"🔍 DEBUG: Adapter '{adapter_name}' not found in network_data keys: {list(self.network_data.keys())}")
                 elif 'network' in tags:
-                    # Network selected - need to find the parent adapter to get interface name
-                    parent = self.tree.parent(item)
-                    if parent:
-                        parent_text = self.tree.item(parent, 'text')
-                        interface_name = parent_text.split(' (')[0]  # Extract en1 from "en1 (WiFi)"
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: Network '{item_text}' belongs to adapter '{interface_name}'")
-                        if interface_name in self.network_data:
-                            selected_networks.append(interface_name)
-                            if self.debug_mode:
-                                print(f"🔍 DEBUG: Added network '{interface_name}' to selected_networks")
-                        else:
-                            if self.debug_mode:
-                                print(f"🔍 DEBUG: Interface '{interface_name}' not found in network_data keys: {list(self.network_data.keys())}")
+                    # Network selected - cast to its adapter's interface
+                    interface_name = key[1]
+                    if debug:
+                        print(f"🔍 DEBUG: Network '{item_text}' belongs to adapter '{interface_name}'")
+                    if interface_name in self.network_data:
+                        selected_networks.append(interface_name)
+                        if debug:
+                            print(f"🔍 DEBUG: Added network '{interface_name}' to selected_networks")
                     else:
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: Network '{item_text}' has no parent")
+                        if debug:
+                            print(f"🔍 DEBUG: Interface '{interface_name}' not found in network_data keys: {list(self.network_data.keys())}")
                 elif any(tag.startswith('device_') for tag in tags):
-                    # Device selected - need to find the grandparent adapter to get interface name
-                    network_parent = self.tree.parent(item)
-                    if network_parent:
-                        adapter_parent = self.tree.parent(network_parent)
-                        if adapter_parent:
-                            adapter_text = self.tree.item(adapter_parent, 'text')
-                            interface_name = adapter_text.split(' (')[0]  # Extract en1 from "en1 (WiFi)"
-                        device_ip = self.tree.item(item, 'values')[1]
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: Device '{item_text}' (IP: {device_ip}) belongs to adapter '{interface_name}'")
-
-                        # Find the device in our data
-                        for device in self.device_data.get(interface_name, []):
-                            if device['ip'] == device_ip:
-                                selected_devices.append((interface_name, device))
-                                if self.debug_mode:
-                                    print(f"🔍 DEBUG: Added device '{device_ip}' to selected_devices")
-                                break
-                        else:
-                            if self.debug_mode:
-                                print(f"🔍 DEBUG: Device '{item_text}' has no grandparent adapter")
+                    # Device selected - key is ('device', interface, subnet, ip)
+                    interface_name, device_ip = key[1], key[3]
+                    if debug:
+                        print(f"🔍 DEBUG: Device '{item_text}' (IP: {device_ip}) belongs to adapter '{interface_name}'")
+
+                    # Find the device in our data
+                    device = self._device_index.get(interface_name, {}).get(device_ip)
+                    if device is not None:
+                        selected_devices.append((interface_name, device))
+                        if debug:
+                            print(f"🔍 DEBUG: Added device '{device_ip}' to selected_devices")
                     else:
-                        if self.debug_mode:
-                            print(f"🔍 DEBUG: Device '{item_text}' has no parent network")
+                        if debug:
+                            print(f"🔍 DEBUG: Device '{device_ip}' not found under '{interface_name}'")
 
-            # Check children
-            for child in self.tree.get_children(item):
-                check_item(child)
-
-        # Check all top-level items
-        for item in self.tree.get_children():
+        # Walk the tree top-down with an explicit stack, children reversed so rows come out in display order
+        stack = list(reversed(self.tree.get_children()))
+        while stack:
+            item = stack.pop()
             check_item(item)
+            stack.extend(reversed(self.tree.get_children(item)))
 
-        if self.debug_mode:
+        if debug:
             print(f"🔍 DEBUG: Final selection - Networks: {selected_networks}, Devices: {len(selected_devices)}")
         return selected_networks, selected_devices
 
@@ -2554,7 +3233,7 @@ rm '{temp_file_path}'
                 for net in selected_networks:
                     try:
                         network = ipaddress.IPv4Network(self.network_data[net]['subnet'], strict=False)
-                        total_targets += len(list(network.hosts())) + 2
+                        total_targets += _host_count(network) + 2
                     except Exception:
                         total_targets += 254  # Reasonable estimate
 
@@ -2600,12 +3279,25 @@ rm '{temp_file_path}'
                     for interface_name in selected_networks:
                         interface_info = self.network_data[interface_name]
                         network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
-                        total_targets += len(list(network.hosts())) + 2
+                        total_targets += _host_count(network) + 2
 
                     total_targets += len(selected_devices)
 
+                    # Post progress to the Tk thread every ~0.5% or _CAST_PROGRESS_INTERVAL seconds,
+                    # not once per packet - a /16 would otherwise queue 65k callbacks
+                    progress_step = max(1, total_targets // 200)
+                    last_reported = 0
+                    last_report_time = time.monotonic()
+
+                    def report_progress(message, done):
+                        nonlocal last_reported, last_report_time
+                        now = time.monotonic()
+                        if done - last_reported >= progress_step or now - last_report_time >= _CAST_PROGRESS_INTERVAL:
+                            last_reported, last_report_time = done, now
+                            self._post_ui(self.update_progress, message, done, total_targets)
+
                     # Show progress bar
-                    self.root.after(0, lambda: self.show_progress_bar("Preparing cast...", 0, total_targets))
+                    self._post_ui(self.show_progress_bar, "Preparing cast...", 0, total_targets)
 
                     # Small delay to ensure progress bar is visible
                     time.sleep(0.1)
@@ -2621,18 +3313,13 @@ rm '{temp_file_path}'
                         # Create magic packet
                         magic_packet = create_magic_packet()
 
-                        # Send to all IPs in network
-                        host_ips = list(network.hosts())
-                        for i, ip in enumerate(host_ips):
-                            if not self.broadcasting_active:  # Check if stopped
-                                break
-
-                            send_magic_packet_to_ip(str(ip), magic_packet)
-                            completed += 1
-
-                            # Update progress on every completion for smooth animation
-                            self.root.after(0, lambda c=completed, t=total_targets:
-                                          self.update_progress(f"Casting to {interface_name}...", c, t))
+                        # Send to all IPs in network, a slice per task on a few threads
+                        message = f"Casting to {interface_name}..."
+                        sent_before = completed
+                        completed += _send_magic_packets(
+                            list(_iter_host_ips(network)), magic_packet,
+                            on_progress=lambda sent: report_progress(message, sent_before + sent),
+                            should_stop=lambda: not self.broadcasting_active)
 
                     # Cast to selected devices
                     for interface_name, device in selected_devices:
@@ -2641,20 +3328,19 @@ rm '{temp_file_path}'
 
                         send_magic_packet_to_device(device)
                         completed += 1
-                        self.root.after(0, lambda c=completed, t=total_targets:
-                                      self.update_progress("Sending to selected devices...", c, t))
+                        report_progress("Sending to selected devices...", completed)
 
                     # Ensure progress shows 100% completion
-                    self.root.after(0, lambda: self.update_progress("Cast complete!", total_targets, total_targets))
+                    self._post_ui(self.update_progress, "Cast complete!", total_targets, total_targets)
 
                     # Show completion message
                     if self.broadcasting_active:
-                        self.root.after(0, self.broadcast_complete)
+                        self._post_dialog(self.broadcast_complete)
                     else:
-                        self.root.after(0, self.broadcast_stopped)
+                        self._post_dialog(self.broadcast_stopped)
 
                 except Exception as e:
-                    self.root.after(0, lambda error_msg=str(e): self.broadcast_error(error_msg))
+                    self._post_dialog(self.broadcast_error, str(e))
 
             threading.Thread(target=broadcast_worker, daemon=True).start()
         except Exception as e:
@@ -2698,18 +3384,24 @@ rm '{temp_file_path}'
         self.progress_bar['value'] = 0
         self.progress_bar['maximum'] = total
         self.progress_frame.pack(pady=(0, 10), fill=tk.X, padx=20)
-        # Force immediate GUI update
+        # Draw it now; a full update() here would re-enter the event loop
         self.root.update_idletasks()
-        self.root.update()
 
     def update_progress(self, message, current, total):
-        """Update the progress bar."""
+        """Update the progress bar (redraws are coalesced to _PROGRESS_FLUSH_MS)."""
+        self._progress_state = (message, current, total)
+        if not self._progress_flush_pending:
+            self._progress_flush_pending = True
+            self.root.after(_PROGRESS_FLUSH_MS, self._flush_progress)
+
+    def _flush_progress(self):
+        """Draw the latest progress state posted by update_progress."""
+        self._progress_flush_pending = False
         try:
-            self.progress_label.config(text=message)
+            message, current, total = self._progress_state
             self.progress_bar['value'] = current
             percentage = (current / total) * 100 if total > 0 else 0
             self.progress_label.config(text=f"{message} ({percentage:.1f}%)")
-            # Force immediate GUI update for smooth animation
             self.root.update_idletasks()
         except Exception as e:
             print(f"Progress update error: {e}")
@@ -2803,6 +3495,8 @@ rm '{temp_file_path}'
         if not self.scanning_active and not self.broadcasting_active:
             self.scanning_active = True
             print(f"🔮 Manual scry started (scanning_active = {self.scanning_active})")
+            # A manual scry should pick up adapters that changed since the last cycle
+            invalidate_interface_cache()
             self.scan_thread = threading.Thread(target=self.scan_worker, daemon=True)
             self.scan_thread.start()
 
@@ -2810,7 +3504,7 @@ rm '{temp_file_path}'
             self.update_scan_button_state()
 
             # Update status
-            self.status_label.config(text="Scrying networks and devices...")
+            self._status_var.set("Scrying networks and devices...")
 
     def update_scan_button_state(self):
         """Update the scan button to reflect the current scanning state."""
@@ -2837,7 +3531,7 @@ rm '{temp_file_path}'
         print(f"🔮 Scry manually stopped (scanning_active = {self.scanning_active})")
 
         # Clear any progress message immediately
-        self.root.after(0, lambda: self.status_label.config(text="Scrying will end at next boundary..."))
+        self._status_var.set("Scrying will end at next boundary...")
 
         # Update scan button to reflect stopped state
         self.update_scan_button_state()
@@ -2921,6 +3615,8 @@ rm '{temp_file_path}'
                         print(f"🔄 Device already exists: {device_data.get('ip', 'Unknown')}")
                 
                 # Save the imported data
+                self._dirty = True
+                self._tree_generation += 1
                 self.save_persistent_data()
                 
                 # Show import summary
@@ -2984,8 +3680,8 @@ rm '{temp_file_path}'
                     }
                 }
                 
-                with open(filename, 'w') as f:
-                    json.dump(export_data, f, indent=2)
+                with open(filename, 'w', encoding='utf-8') as f:
+                    f.write(_json_dumps_pretty(export_data))
                 
                 print(f"✅ Exported {len(devices_to_export)} devices to {filename}")
                 print(f"   Export format includes: {list(export_data.keys())}")
@@ -3007,6 +3703,7 @@ rm '{temp_file_path}'
             self.tree_expanded_states.clear()
             
             # Save the cleared state
+            self._dirty = True
             self.save_persistent_data()
             
             print("✅ History cleared")
@@ -3026,7 +3723,7 @@ def get_network_summary(interfaces):
     for iface in interfaces:
         try:
             network = ipaddress.IPv4Network(iface['subnet'], strict=False)
-            address_count = len(list(network.hosts())) + 2
+            address_count = _host_count(network) + 2
             range_display = format_network_range(iface['subnet'])
 
             summary.append({
@@ -3059,7 +3756,7 @@ def broadcast_to_subnet(interface_info, progress_callback=None, verbose=False, i
     network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
 
     # Get all host IPs in the network
-    host_ips = [str(ip) for ip in network.hosts()]
+    host_ips = list(_iter_host_ips(network))
 
     # Also include network and broadcast addresses for completeness
     all_ips = [str(network.network_address)] + host_ips + [str(network.broadcast_address)]
@@ -3077,40 +3774,28 @@ def broadcast_to_subnet(interface_info, progress_callback=None, verbose=False, i
         for line in wrapped_lines:
             print(line)
 
-    # Use ThreadPoolExecutor for concurrent sending
-    with ThreadPoolExecutor(max_workers=50) as executor:
-        futures = []
-        for ip in all_ips:
-            future = executor.submit(send_magic_packet_to_ip, ip, magic_packet)
-            futures.append(future)
-
-        # Wait for all to complete with progress tracking
-        completed = 0
-        for i, future in enumerate(futures):
-            try:
-                future.result(timeout=1.0)
-            except Exception:
-                pass
-            completed += 1
+    def report(completed):
+        # Update progress
+        if progress_callback:
+            progress_callback(completed, len(all_ips), interface_info['interface'])
 
-            # Update progress
-            if progress_callback:
-                progress_callback(completed, len(all_ips), interface_info['interface'])
+        # CLI progress bar
+        if verbose and not is_gui_mode:
+            progress_bar = create_progress_bar(completed, len(all_ips),
+                                             prefix=f"{interface_info['interface'][:12]}")
+            # Use proper terminal control sequences for line clearing
+            terminal_width = get_terminal_size().columns
+            # Clear entire line and rewrite
+            sys.stdout.write('\r' + ' ' * terminal_width + '\r')
+            sys.stdout.write(progress_bar)
+            sys.stdout.flush()
 
-            # CLI progress bar
-            if verbose and not is_gui_mode and (completed % max(1, len(all_ips) // 100) == 0 or completed == len(all_ips)):
-                progress_bar = create_progress_bar(completed, len(all_ips),
-                                                 prefix=f"{interface_info['interface'][:12]}")
-                # Use proper terminal control sequences for line clearing
-                terminal_width = get_terminal_size().columns
-                # Clear entire line and rewrite
-                sys.stdout.write('\r' + ' ' * terminal_width + '\r')
-                sys.stdout.write(progress_bar)
-                sys.stdout.flush()
+    # Send concurrently, reporting progress as each slice of addresses completes
+    completed = _send_magic_packets(all_ips, magic_packet, on_progress=report)
 
-        if verbose and not is_gui_mode:
-            print()  # New line after progress bar completion
-            print(f"Completed {interface_info['interface']}: {completed:,} packets sent")
+    if verbose and not is_gui_mode:
+        print()  # New line after progress bar completion
+        print(f"Completed {interface_info['interface']}: {completed:,} packets sent")
 
     return completed
 
@@ -3213,21 +3898,22 @@ def load_cli_persistent_data():
 
     ✅ FIXED: CLI now uses known_devices instead of discovered_devices for unified data structure.
     """
+    global _DEBUG
     try:
         # Use EXACT SAME file path as GUI
         data_dir = os.path.expanduser("~/.wol_caster")
         devices_file = os.path.join(data_dir, "known_devices.json")
         if os.path.exists(devices_file):
-            with open(devices_file, 'r') as f:
-                cli_persistent_data['known_devices'] = json.load(f)
+            with open(devices_file, 'rb') as f:
+                cli_persistent_data['known_devices'] = _json_loads(f.read())
         else:
             cli_persistent_data['known_devices'] = {}
 
         # Load debug mode setting (same file as GUI)
         debug_file = os.path.join(data_dir, "debug_settings.json")
         if os.path.exists(debug_file):
-            with open(debug_file, 'r') as f:
-                debug_settings = json.load(f)
+            with open(debug_file, 'rb') as f:
+                debug_settings = _json_loads(f.read())
                 cli_persistent_data['debug_mode'] = debug_settings.get('debug_mode', False)
         else:
             # Default to disabled
@@ -3237,6 +3923,8 @@ def load_cli_persistent_data():
         cli_persistent_data['known_devices'] = {}
         cli_persistent_data['debug_mode'] = False
 
+    _DEBUG = cli_persistent_data['debug_mode']
+
 def get_cli_selection():
     """Get user selection in CLI mode with single network viewing, progress bar, and persistent data."""
     # Get network interfaces
@@ -3357,7 +4045,7 @@ def get_cli_selection():
                         selected_network_summaries.append({
                             'interface': net_name,
                             'range': format_network_range(interface_info['subnet']),
-                            'count': len(list(network.hosts())) + 2,
+                            'count': _host_count(network) + 2,
                             'host_ip': interface_info['ip']
                         })
 
@@ -3457,7 +4145,7 @@ def display_cli_tree(network_data, device_data, selected_networks=None, selected
                 if device['mac']:
                     device_line += f" ({device['mac']})"
                     # Add vendor information
-                    vendor = get_mac_vendor(device['mac'], silent=True)
+                    vendor = _cached_vendor(device['mac'])
                     if vendor:
                         device_line += f" - {vendor}"
                 # Don't add redundant status - it's already shown by the status symbol
@@ -3477,59 +4165,24 @@ def scan_network_for_devices_with_progress(interface_info):
     """Scan a network with CLI progress bar and interrupt support."""
     try:
         network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
-        host_ips = [str(ip) for ip in network.hosts()]
-
-        # Chunked scanning for large networks
-        chunk_size = 255
-        total_ips = len(host_ips)
-
-        devices = []
-        scanned = 0
+        total_ips = _host_count(network)
         interrupted = False
 
-        print(f"Scrying {total_ips} addresses in chunks of {chunk_size}...")
+        print(f"Scrying {total_ips} addresses...")
         print("Press '.' to interrupt scry and show discovered devices")
 
-        # Process in chunks
-        for chunk_start in range(0, total_ips, chunk_size):
-            if interrupted:
-                break
-
-            chunk_end = min(chunk_start + chunk_size, total_ips)
-            chunk_ips = host_ips[chunk_start:chunk_end]
-
-            # Show progress
-            progress = (scanned / total_ips) * 100
-            progress_bar = create_progress_bar(scanned, total_ips, prefix=f"{interface_info['interface']}")
+        def show_progress(completed, total):
+            progress_bar = create_progress_bar(completed, total, prefix=f"{interface_info['interface']}")
             print(f"\r{progress_bar}", end='', flush=True)
 
-            # Check for interrupt key
-            if check_for_interrupt():
+        def should_stop():
+            nonlocal interrupted
+            if not interrupted and check_for_interrupt():
                 interrupted = True
-                print(f"\nScry interrupted by user. Showing {len(devices)} discovered devices.")
-                break
-
-            # Use ThreadPoolExecutor for concurrent scanning within chunk
-            with ThreadPoolExecutor(max_workers=20) as executor:
-                device_futures = []
-
-                for ip in chunk_ips:
-                    future = executor.submit(scan_single_ip, ip)
-                    device_futures.append(future)
-
-                for future in device_futures:
-                    try:
-                        device = future.result(timeout=3)
-                        if device and device['status'] != "hidden":
-                            devices.append(device)
-                        scanned += 1
-                    except Exception:
-                        scanned += 1
-                        continue
+            return interrupted
 
-            # Small delay between chunks
-            if chunk_end < total_ips:
-                time.sleep(0.1)
+        show_progress(0, total_ips)
+        devices = scan_network(interface_info, completed_callback=show_progress, should_stop=should_stop)
 
         # Final progress bar
         if not interrupted:
@@ -3537,7 +4190,7 @@ def scan_network_for_devices_with_progress(interface_info):
             print(f"\r{progress_bar}")
             print(f"Found {len(devices)} devices on {interface_info['interface']}")
         else:
-            print(f"Scry interrupted. Found {len(devices)} devices on {interface_info['interface']}")
+            print(f"\nScry interrupted. Found {len(devices)} devices on {interface_info['interface']}")
 
         return devices
     except Exception as e:
@@ -3556,37 +4209,6 @@ def check_for_interrupt():
     except Exception:
         return False
 
-def scan_single_ip(ip):
-    """Scan a single IP address."""
-    try:
-        status = check_device_status(ip)
-        hostname = None
-        mac_address = None
-
-        if status in ["online", "standby"]:
-            hostname = get_device_identifier(ip)
-            mac_address = get_mac_address(ip)
-
-        # Determine hostname
-        if status in ["online", "standby"]:
-            display_hostname = hostname or f".{ip.split('.')[-1]}"
-        else:
-            status = "hidden"
-            display_hostname = None
-
-        device = {
-            'ip': ip,
-            'hostname': display_hostname,
-            'mac': mac_address,
-            'status': status,
-            'pingable': status == "online",
-            'last_seen': time.time() if status in ["online", "standby"] else 0
-        }
-
-        return device
-    except Exception:
-        return None
-
 def run_cli():
     """Run enhanced CLI mode with parallel scanning and single-character menu."""
     # Try to resize terminal first if it's too small
@@ -3674,7 +4296,9 @@ def show_cli_main_menu():
 
 def toggle_debug_mode_cli():
     """Toggle debug mode on/off with user feedback."""
+    global _DEBUG
     cli_persistent_data['debug_mode'] = not cli_persistent_data['debug_mode']
+    _DEBUG = cli_persistent_data['debug_mode']
     status = "🔧 DEBUG MODE ENABLED" if cli_persistent_data['debug_mode'] else "🔧 DEBUG MODE DISABLED"
     print(f"\n{status}")
     print("=" * len(status))
@@ -3744,48 +4368,61 @@ def scan_network_parallel(interface_info):
     """Scan a network using parallel processing for speed."""
     try:
         network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
-        host_ips = [str(ip) for ip in network.hosts()]
+        host_ips = list(_iter_host_ips(network))
         total_ips = len(host_ips)
 
+        # One ARP snapshot per pass; only hosts missing from it need their own `arp` call
+        arp_table = build_arp_table()
+
         print(f"   📊 Scrying {total_ips} IP addresses...")
 
         if cli_persistent_data['debug_mode']:
-            print(f"   🔧 DEBUG: Using ThreadPoolExecutor with max_workers=50")
+            print(f"   🔧 DEBUG: Using the shared scan pool with max_workers={SCAN_MAX_WORKERS}")
             print(f"   🔧 DEBUG: Network range: {interface_info['subnet']}")
 
         # Use parallel processing
         devices = []
-        with ThreadPoolExecutor(max_workers=50) as executor:
-            # Submit all IP scans
-            future_to_ip = {executor.submit(scan_single_ip_fast, ip): ip for ip in host_ips}
+        # Scan on the shared pool, keeping a bounded window of hosts in flight like scan_network
+        executor = _SCAN_POOL
+        window = max(1, min(SCAN_MAX_WORKERS, total_ips)) * 4
+        host_iter = iter(host_ips)
+        pending = set()
+        for ip in host_iter:
+            pending.add(executor.submit(scan_single_ip_fast, ip, arp_table))
+            if len(pending) >= window:
+                break
 
-            if cli_persistent_data['debug_mode']:
-                print(f"   🔧 DEBUG: Submitted {len(future_to_ip)} scan tasks")
+        if cli_persistent_data['debug_mode']:
+            print(f"   🔧 DEBUG: Scanning with up to {window} tasks in flight")
 
-            # Process results with progress bar
-            completed = 0
-            for future in as_completed(future_to_ip):
+        # Process results with progress bar, topping the window up as probes finish
+        completed = 0
+        while pending:
+            done, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for ip in host_iter:
+                pending.add(executor.submit(scan_single_ip_fast, ip, arp_table))
+                if len(pending) >= window:
+                    break
+
+            for future in done:
                 try:
-                    device = future.result(timeout=1)
+                    device = future.result()
                     if device and device['status'] != "hidden":
                         devices.append(device)
                         if cli_persistent_data['debug_mode']:
                             print(f"   🔧 DEBUG: Found device {device['ip']} - {device.get('hostname', 'No hostname')}")
-                    completed += 1
-
-                    # Update progress bar on every completion for smooth animation
-                    progress = (completed / total_ips) * 100
-                    progress_bar = create_progress_bar_cli(completed, total_ips, width=40)
-                    # Use fixed-width formatting to prevent text jumping
-                    status_text = f"   {progress_bar} {completed}/{total_ips} ({progress:.1f}%)"
-                    # Clear line and update in place with proper line clearing
-                    print(f"\r{' ' * 80}\r{status_text}", end='', flush=True)
-
                 except Exception as e:
-                    completed += 1
                     if cli_persistent_data['debug_mode']:
                         print(f"   🔧 DEBUG: Error scanning IP: {e}")
-                    continue
+                completed += 1
+
+            # Update progress bar once per batch of completions
+            progress = (completed / total_ips) * 100
+            progress_bar = create_progress_bar_cli(completed, total_ips, width=40)
+            # Use fixed-width formatting to prevent text jumping
+            status_text = f"   {progress_bar} {completed}/{total_ips} ({progress:.1f}%)"
+            # Clear line and update in place with proper line clearing
+            print(f"\r{' ' * 80}\r{status_text}", end='', flush=True)
 
         # Final progress bar
         progress_bar = create_progress_bar_cli(total_ips, total_ips, width=40)
@@ -3800,8 +4437,8 @@ def scan_network_parallel(interface_info):
         print(f"   ❌ Scan error: {e}")
         return []
 
-def scan_single_ip_fast(ip):
-    """Fast single IP scan with optimized timeouts."""
+def scan_single_ip_fast(ip, arp_table=None):
+    """Fast single IP scan with optimized timeouts (`arp_table` is an optional build_arp_table() snapshot)."""
     try:
         # Quick ping check (500ms timeout)
         is_pingable = ping_host_fast(ip)
@@ -3809,13 +4446,13 @@ def scan_single_ip_fast(ip):
         if is_pingable:
             # Device is online, get basic info
             hostname = get_device_identifier_fast(ip)
-            mac_address = get_mac_address_fast(ip)
+            mac_address = (arp_table or {}).get(ip) or get_mac_address_fast(ip)
 
             # Get vendor info if MAC is available (same logic as GUI)
             vendor_info = None
             if mac_address:
                 try:
-                    vendor_info = get_mac_vendor(mac_address, silent=True)
+                    vendor_info = _cached_vendor(mac_address)
                 except Exception:
                     pass
 
@@ -3847,14 +4484,12 @@ def scan_single_ip_fast(ip):
 def ping_host_fast(ip):
     """Fast ping with 500ms timeout."""
     try:
-        system = platform.system().lower()
-        if system == "windows":
+        if _SYSTEM == "Windows":
             cmd = ["ping", "-n", "1", "-w", "500", ip]
         else:
             cmd = ["ping", "-c", "1", "-W", "500", ip]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1)
-        return result.returncode == 0
+        return subprocess.call(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, timeout=1) == 0
     except Exception:
         return False
 
@@ -3879,16 +4514,13 @@ def get_device_identifier_fast(ip):
     """Fast device identifier lookup using comprehensive discovery methods."""
     try:
         # Method 1: Try to get hostname via standard DNS resolution
-        try:
-            hostname = socket.gethostbyaddr(ip)[0]
-            if hostname and hostname != ip and len(hostname) > 2:
-                return hostname
-        except Exception:
-            pass
+        hostname = _reverse_dns(ip)
+        if hostname and hostname != ip and len(hostname) > 2:
+            return hostname
 
         # Method 2: Try to get Windows NetBIOS name via smbutil (macOS only)
         try:
-            if platform.system() == 'Darwin':  # Only on macOS
+            if _SYSTEM == 'Darwin':  # Only on macOS
                 netbios_name = get_netbios_name_smbutil(ip)
                 if netbios_name:
                     return netbios_name
@@ -3897,7 +4529,7 @@ def get_device_identifier_fast(ip):
 
         # Method 3: Try to get Apple device name via mDNS/Bonjour (macOS only)
         try:
-            if platform.system() == 'Darwin':  # Only on macOS
+            if _SYSTEM == 'Darwin':  # Only on macOS
                 apple_device_name = get_apple_device_name(ip)
                 if apple_device_name:
                     return apple_device_name
@@ -3906,28 +4538,9 @@ def get_device_identifier_fast(ip):
 
         # Method 4: Try to get additional device information via service detection
         try:
-            # Check for common service names
-            service_ports = {
-                22: "SSH",
-                23: "Telnet",
-                80: "HTTP",
-                443: "HTTPS",
-                3389: "RDP",
-                5900: "VNC",
-                8080: "HTTP-Alt",
-                8443: "HTTPS-Alt"
-            }
-
-            for port, service in service_ports.items():
-                try:
-                    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-                    sock.settimeout(0.2)  # Faster timeout for CLI
-                    result = sock.connect_ex((ip, port))
-                    sock.close()
-                    if result == 0:
-                        return f"{service}-{ip.split('.')[-1]}"
-                except Exception:
-                    continue
+            port = _probe_service_port(ip, timeout=0.2)  # Faster timeout for CLI
+            if port is not None:
+                return f"{_SERVICE_NAMES[port]}-{ip.split('.')[-1]}"
         except Exception:
             pass
 
@@ -3938,17 +4551,15 @@ def get_device_identifier_fast(ip):
 def get_mac_address_fast(ip):
     """Fast MAC address lookup with automatic padding."""
     try:
-        system = platform.system().lower()
-        if system == "windows":
+        if _SYSTEM == "Windows":
             cmd = ["arp", "-a", ip]
         else:
             cmd = ["arp", "-n", ip]
 
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=1)
+        result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True, timeout=1)
         if result.returncode == 0:
             output = result.stdout
-            mac_pattern = r'([0-9a-fA-F]{2}[:-]){5}[0-9a-fA-F]{2}'
-            match = re.search(mac_pattern, output)
+            match = _MAC_RE_STRICT.search(output)
             if match:
                 mac = match.group(0).upper().replace('-', ':')
                 # Apply MAC padding rule: pad with leading zeros to reach 12 characters
@@ -4040,14 +4651,7 @@ def view_devices_cli():
             network_groups = {}
             for device in merged_devices:
                 # Determine network for this device (EXACT SAME LOGIC AS GUI)
-                if device['ip'].startswith('192.168.0.'):
-                    network_key = '192.168.0.0/24'
-                elif device['ip'].startswith('134.124.230.'):
-                    network_key = '134.124.230.0/24'  # Separate from 134.124.231.*
-                elif device['ip'].startswith('134.124.231.'):
-                    network_key = '134.124.231.0/24'  # Separate network
-                else:
-                    network_key = 'unknown_network'
+                network_key = _classify_network(device['ip'], 'unknown_network')
 
                 if network_key not in network_groups:
                     network_groups[network_key] = []
@@ -4138,7 +4742,7 @@ def view_selected_targets_cli():
             if network_interface:
                 try:
                     network_obj = ipaddress.IPv4Network(network_interface['subnet'], strict=False)
-                    address_count = len(list(network_obj.hosts())) + 2
+                    address_count = _host_count(network_obj) + 2
                     print(f"   📡 {network} ({network_interface['subnet']}) - {address_count:,} addresses")
                 except Exception:
                     print(f"   📡 {network} ({network_interface['subnet']})")
@@ -4191,7 +4795,7 @@ def view_selected_targets_cli():
         if network_interface:
             try:
                 network_obj = ipaddress.IPv4Network(network_interface['subnet'], strict=False)
-                total_targets += len(list(network_obj.hosts())) + 2
+                total_targets += _host_count(network_obj) + 2
             except Exception:
                 total_targets += 254  # Estimate
 
@@ -4221,7 +4825,7 @@ def select_targets_cli():
             if network_interface:
                 try:
                     network_obj = ipaddress.IPv4Network(network_interface['subnet'], strict=False)
-                    total_targets += len(list(network_obj.hosts())) + 2
+                    total_targets += _host_count(network_obj) + 2
                 except Exception:
                     total_targets += 254  # Estimate
         total_targets += len(cli_persistent_data['selected_devices'])
@@ -4511,7 +5115,7 @@ def broadcast_to_network_cli(interface_info):
     """Cast to a specific network."""
     try:
         network = ipaddress.IPv4Network(interface_info['subnet'], strict=False)
-        host_ips = list(network.hosts())
+        host_ips = list(_iter_host_ips(network))
         total_ips = len(host_ips)
 
         print(f"📡 Casting to {interface_info['interface']} ({total_ips} addresses)...")
@@ -4519,27 +5123,16 @@ def broadcast_to_network_cli(interface_info):
         # Create magic packet
         magic_packet = create_magic_packet()
 
-        # Send with progress bar
-        completed = 0
-        with ThreadPoolExecutor(max_workers=20) as executor:
-            futures = [executor.submit(send_magic_packet_to_ip, str(ip), magic_packet) for ip in host_ips]
-
-            for future in as_completed(futures):
-                try:
-                    future.result(timeout=1)
-                    completed += 1
-
-                    # Update progress on every completion for smooth animation
-                    progress = (completed / total_ips) * 100
-                    progress_bar = create_progress_bar_cli(completed, total_ips, width=30)
-                    # Use fixed-width formatting to prevent text jumping
-                    status_text = f"   {progress_bar} {completed}/{total_ips} ({progress:.1f}%)"
-                    # Clear line and update in place with proper line clearing
-                    print(f"\r{' ' * 60}\r{status_text}", end='', flush=True)
+        def show_progress(completed):
+            progress = (completed / total_ips) * 100
+            progress_bar = create_progress_bar_cli(completed, total_ips, width=30)
+            # Use fixed-width formatting to prevent text jumping
+            status_text = f"   {progress_bar} {completed}/{total_ips} ({progress:.1f}%)"
+            # Clear line and update in place with proper line clearing
+            print(f"\r{' ' * 60}\r{status_text}", end='', flush=True)
 
-                except Exception:
-                    completed += 1
-                    continue
+        # Send with progress bar, updated as each slice of addresses completes
+        _send_magic_packets(host_ips, magic_packet, on_progress=show_progress)
 
         # Final progress bar
         progress_bar = create_progress_bar_cli(total_ips, total_ips, width=30)
@@ -4570,10 +5163,10 @@ def print_persistent_data_cli():
         return
 
     print("📁 Current CLI Data:")
-    print(json.dumps(cli_persistent_data, indent=2, default=str))
+    print(_json_dumps_pretty(cli_persistent_data))
 
     print("\n📁 Persistent Data from known_devices.json:")
-    print(json.dumps(cli_persistent_data['known_devices'], indent=2, default=str))
+    print(_json_dumps_pretty(cli_persistent_data['known_devices']))
 
     print("\n💡 This shows the exact data structure used by both CLI and GUI.")
     print("🔒 CLI is read-only - only the GUI writes to persistent data.")
@@ -4626,7 +5219,7 @@ Examples:
 
 def show_version():
     """Show version information."""
-    print("WoL-Caster v1.0.0")
+    print(f"WoL-Caster v{__version__}")
     print("Wake-on-LAN Network Broadcaster with Perfect GUI & CLI Interrupt")
     print("Features: Fixed GUI colors, toggle sorting, CLI interrupt (.), persistent CLI data")
 
@@ -4722,7 +5315,7 @@ def get_apple_device_name(ip):
             for suffix in apple_suffixes:
                 try:
                     # Try to resolve the IP with Apple suffixes
-                    hostname = socket.gethostbyaddr(ip)[0]
+                    hostname = _reverse_dns(ip)
                     if hostname and hostname != ip and len(hostname) > 2:
                         # Check if it looks like an Apple device name
                         if any(suffix in hostname for suffix in apple_suffixes):
@@ -4879,7 +5472,7 @@ def get_priority_device_display(device):
         # For offline devices, use stored vendor info if available
         if device['status'] in ['online', 'standby']:
             # Fresh lookup for active devices
-            vendor = get_mac_vendor(device['mac'], silent=True)
+            vendor = _cached_vendor(device['mac'])
             if vendor and vendor != "Unknown":
                 identifier = vendor
             else: